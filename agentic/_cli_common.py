@@ -0,0 +1,91 @@
+"""Console helpers shared by the agentic CLI and the legacy workflow.py entry point."""
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def _console():
+    """Shared rich Console, created (and rich imported) on first use."""
+    from rich.console import Console
+    
+    return Console()
+
+
+def __getattr__(name: str):
+    """Expose `console` lazily for `from agentic._cli_common import console`."""
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Same tag shape rich's markup parser accepts; "\[" escapes a literal bracket
+_MARKUP_TAG_RE = re.compile(r'(?<!\\)\[[a-z#/@][^\[]*?\]')
+
+
+def plain_printer(console):
+    """
+    `console.print` on a terminal, otherwise a plain print of the text with
+    the markup tags removed.
+    
+    When output goes to a file or CI log rich would throw the styling away
+    anyway, after parsing markup and measuring every line.
+    """
+    if console.is_terminal:
+        return console.print
+    
+    def _print(*objects, **kwargs):
+        print(*(_MARKUP_TAG_RE.sub('', str(o)).replace('\\[', '[') for o in objects), flush=True)
+    
+    return _print
+
+
+# Status icon plus separator, ready to prefix a step line
+_STATUS_PREFIXES = {
+    "": "⏳ ",
+    "done": "[green]✓[/green] ",
+    "skip": "[yellow]○[/yellow] ",
+    "error": "[red]✗[/red] ",
+    "wait": "[cyan]⏸[/cyan] "
+}
+
+
+@lru_cache(maxsize=None)
+def _banner():
+    """Banner panel, built once (rich renderables can be printed repeatedly)."""
+    from rich.panel import Panel
+    
+    return Panel.fit(
+        "[bold blue]🚀 Agentic Development Workflow[/bold blue]\n"
+        "[dim]Jira → TDD → PR → Done[/dim]",
+        border_style="blue"
+    )
+
+
+def print_banner():
+    """Print welcome banner."""
+    _console().print(_banner())
+
+
+def print_step(step: int, total: int, message: str, status: str = ""):
+    """Print workflow step."""
+    _console().print(f"{_STATUS_PREFIXES.get(status, '⏳ ')}[{step}/{total}] {message}")
+
+
+def stub_pbi(pbi_key: str):
+    """Placeholder PBI used when Jira is skipped (--skip-jira)."""
+    from .jira_connector import PBIData
+    
+    return PBIData(
+        key=pbi_key,
+        summary="Test PBI Summary",
+        description="Test description",
+        acceptance_criteria=["AC 1", "AC 2", "AC 3"],
+        status="To Do",
+        issue_type="Story",
+        priority="Medium",
+        labels=[],
+        assignee=None,
+        reporter="test@test.com",
+        url=f"https://jira.example.com/browse/{pbi_key}"
+    )
@@ -1,10 +1,14 @@
 """Auto-fixer for simple PR review comments."""
 
+import mmap
 import re
 import subprocess
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Set, Tuple, List
 from dataclasses import dataclass
+from functools import lru_cache
 
 from rich.console import Console
 
@@ -12,8 +16,226 @@ from .pr_review import PRComment, CommentCategory, FixDifficulty
 
 console = Console()
 
+# Patterns used by the fix handlers
+_RE_USE_CONST_LET = re.compile(r'use\s+(const|let)\s+instead', re.IGNORECASE)
+_RE_USE_VAR_CAPTURE = re.compile(r'use\s+[`\']?(const|let)[`\']?\s+instead', re.IGNORECASE)
+_RE_EXTRA = re.compile(r'extra', re.IGNORECASE)
+_RE_MISSING = re.compile(r'missing', re.IGNORECASE)
+_RE_VAR_LET_CONST = re.compile(r'\b(var|let|const)\b')
+_RE_JS_DECL = re.compile(r'^(\s*)\b(var|let|const)\b')
+_DECL_PREFIXES = ('var ', 'let ', 'const ')
+_RE_SUGGESTION_OPEN = re.compile(r'```suggestion\s*\n')
+_RE_TYPO = re.compile(r'[`\'\"](\w+)[`\'\"]\s*(?:→|->|to|should be)\s*[`\'\"](\w+)[`\'\"]')
 
-@dataclass
+# Dry runs on files at least this big go through mmap instead of a full decode
+_MMAP_MIN_SIZE = 1024 * 1024
+
+
+def _line_bounds(content: str, line: Optional[int]) -> Optional[Tuple[int, int]]:
+    """Return (start, end) offsets of 1-based `line` in content, excluding the newline."""
+    if not line or line < 1:
+        return None
+    find = content.find  # Bound once; this loop runs once per preceding line
+    start = 0
+    for _ in range(line - 1):
+        start = find('\n', start) + 1
+        if not start:
+            return None
+    if start >= len(content):
+        return None
+    end = find('\n', start)
+    return start, (end if end != -1 else len(content))
+
+
+def _mapped_lines(mm: mmap.mmap, wanted: Set[int]) -> Dict[int, str]:
+    """Decode the 1-based lines in `wanted` from a mapped file in one forward pass."""
+    find = mm.find
+    lines = {}
+    size = len(mm)
+    start, number = 0, 1
+    for line in sorted(wanted):
+        while number < line:
+            start = find(b'\n', start) + 1
+            if not start:
+                return lines
+            number += 1
+        if start >= size:
+            break
+        end = find(b'\n', start)
+        lines[line] = mm[start:end if end != -1 else size].decode('utf-8')
+    return lines
+
+
+def _prose(body: str) -> str:
+    """
+    Return the prose of a comment for keyword triage.
+    
+    The contents of ``` blocks are skipped (they can be large and never hold
+    trigger words), but each block's opener line such as ```suggestion is kept.
+    """
+    if '```' not in body:
+        return body
+    kept = []
+    pos = 0
+    while True:
+        fence = body.find('```', pos)
+        if fence == -1:
+            kept.append(body[pos:])
+            break
+        eol = body.find('\n', fence)
+        close = body.find('```', fence + 3)
+        if close != -1 and (eol == -1 or close < eol):
+            # Inline ```code``` on a single line
+            kept.append(body[pos:close + 3])
+            pos = close + 3
+            continue
+        if eol == -1:
+            kept.append(body[pos:])
+            break
+        kept.append(body[pos:eol])  # Prose up to and including the opener line
+        close = body.find('```', eol)
+        if close == -1:
+            break
+        pos = close + 3
+    return '\n'.join(kept)
+
+
+def _extract_suggestion(body: str) -> Optional[str]:
+    """
+    Return the first ```suggestion block's content, or None.
+    
+    Same result as re.search(r'```suggestion\\s*\\n(.*?)\\n```', body, re.DOTALL),
+    but in linear time: once no closing fence follows an opener, later
+    openers are not rescanned to the end of the body.
+    """
+    no_close_from = len(body) + 1  # No '\n```' starts at or after this index
+    pos = body.find('```suggestion')
+    while pos != -1:
+        opener = _RE_SUGGESTION_OPEN.match(body, pos)
+        if opener:
+            start = opener.end()
+            close = body.find('\n```', start) if start < no_close_from else -1
+            if close != -1:
+                return body[start:close]
+            no_close_from = start
+            # Blank lines directly followed by the closing fence
+            if body.startswith('```', start):
+                prev = body.rfind('\n', pos + len('```suggestion'), start - 1)
+                if prev != -1:
+                    return body[prev + 1:start - 1]
+        pos = body.find('```suggestion', pos + 1)
+    return None
+
+
+def _fix_var_keyword(comment: PRComment, prose: str, old_line: str) -> Optional[Tuple[str, str]]:
+    """var → const/let fix."""
+    if not _RE_USE_CONST_LET.search(prose):
+        return None
+    match = _RE_USE_VAR_CAPTURE.search(prose)
+    target_var = match.group(1).lower()
+    # The keyword almost always leads the line; only scan the whole line
+    # (slow on long minified code) when the anchored match misses
+    stripped = old_line.lstrip()
+    if stripped.startswith(_DECL_PREFIXES):
+        indent = len(old_line) - len(stripped)
+        keyword_end = indent + stripped.index(' ')
+        new_line = old_line[:indent] + target_var + old_line[keyword_end:]
+    else:
+        decl = _RE_JS_DECL.match(old_line)
+        if decl:
+            new_line = decl.group(1) + target_var + old_line[decl.end():]
+        else:
+            new_line = _RE_VAR_LET_CONST.sub(target_var, old_line, count=1)
+    if old_line == new_line:
+        return None
+    return new_line, f"Changed to `{target_var}`"
+
+
+def _collapse_spaces(text: str) -> str:
+    """Collapse runs of spaces to a single space using plain string ops."""
+    while '  ' in text:
+        text = text.replace('  ', ' ')
+    return text
+
+
+def _fix_whitespace(comment: PRComment, prose: str, old_line: str) -> Optional[Tuple[str, str]]:
+    """Remove extra whitespace."""
+    if not _RE_EXTRA.search(prose):
+        return None
+    new_line = _collapse_spaces(old_line).rstrip()  # Multiple spaces to single
+    if old_line == new_line:
+        return None
+    return new_line, "Removed extra whitespace"
+
+
+def _fix_semicolon(comment: PRComment, prose: str, old_line: str) -> Optional[Tuple[str, str]]:
+    """Add missing semicolon."""
+    if not _RE_MISSING.search(prose):
+        return None
+    if old_line.rstrip().endswith((';', '{', '}', ':')):
+        return None
+    return old_line.rstrip() + ';', "Added semicolon"
+
+
+def _fix_suggestion(comment: PRComment, prose: str, old_line: str) -> Optional[Tuple[str, str]]:
+    """Apply GitHub suggestion block."""
+    suggestion = _extract_suggestion(comment.body)
+    if suggestion is None:
+        return None
+    return suggestion, "Applied suggestion"
+
+
+@lru_cache(maxsize=256)
+def _typo_re(word: str) -> re.Pattern:
+    """Whole-word pattern for a misspelled word, so 'ie' doesn't match inside 'tie'."""
+    return re.compile(r'\b' + re.escape(word) + r'\b')
+
+
+def _fix_typo(comment: PRComment, prose: str, old_line: str) -> Optional[Tuple[str, str]]:
+    """Typo fix."""
+    typo_match = _RE_TYPO.search(comment.body)
+    if not typo_match:
+        return None
+    old_word, new_word = typo_match.groups()
+    new_line, replaced = _typo_re(old_word).subn(new_word, old_line, count=1)
+    if not replaced or old_line == new_line:
+        return None
+    return new_line, f"Fixed typo: {old_word} → {new_word}"
+
+
+# Keyword → handler, in priority order. A keyword scan picks the
+# candidates so only the matching handler's regex runs.
+_FIX_HANDLERS = [
+    ('instead', _fix_var_keyword),
+    ('space', _fix_whitespace),
+    ('semicolon', _fix_semicolon),
+    ('```suggestion', _fix_suggestion),
+    ('typo', _fix_typo),
+]
+
+# All trigger keywords in one alternation, so the body is scanned once no
+# matter how many handlers there are (none of the keywords overlap)
+_RE_FIX_KEYWORDS = re.compile(
+    '|'.join(re.escape(keyword) for keyword, _ in _FIX_HANDLERS), re.IGNORECASE
+)
+
+
+def _fix_line(comment: PRComment, old_line: str) -> Optional[Tuple[str, str]]:
+    """Route a comment to the first handler that fixes `old_line`. Returns (new_line, message) or None."""
+    prose = _prose(comment.body)
+    found = {keyword.lower() for keyword in _RE_FIX_KEYWORDS.findall(prose)}
+    if not found:
+        return None
+    for keyword, handler in _FIX_HANDLERS:
+        if keyword not in found:
+            continue
+        result = handler(comment, prose, old_line)
+        if result:
+            return result
+    return None
+
+
+@dataclass(slots=True)
 class AppliedFix:
     """Record of an applied fix."""
     comment: PRComment
@@ -22,11 +244,21 @@ class AppliedFix:
     message: str
 
 
+def _failed_fixes(comments: List[PRComment], file_path: str, message: str) -> List[AppliedFix]:
+    """Mark every comment on a file as failed with the same message."""
+    return [
+        AppliedFix(comment=c, file_path=file_path, success=False, message=message)
+        for c in comments
+    ]
+
+
 class AutoFixer:
     """Applies automatic fixes for simple PR comments."""
     
     def __init__(self, working_dir: Optional[Path] = None):
         self.working_dir = working_dir or Path.cwd()
+        # path → ((mtime_ns, size), decoded content), reused across apply_fixes calls
+        self._file_cache: Dict[Path, Tuple[Tuple[int, int], str]] = {}
     
     def apply_fixes(self, comments: List[PRComment], dry_run: bool = True) -> List[AppliedFix]:
         """
@@ -35,11 +267,12 @@ class AutoFixer:
         Args:
             comments: List of comments to fix
             dry_run: If True, only show what would be done
-            
+        
         Returns:
             List of applied fixes
         """
-        results = []
+        results: List[Optional[AppliedFix]] = []
+        by_file: Dict[str, List[Tuple[int, PRComment]]] = defaultdict(list)
         
         for comment in comments:
             if comment.difficulty != FixDifficulty.AUTO:
@@ -54,144 +287,201 @@ class AutoFixer:
                 ))
                 continue
             
-            result = self._apply_single_fix(comment, dry_run)
-            results.append(result)
+            by_file[comment.file_path].append((len(results), comment))
+            results.append(None)
+        
+        # One read and one write per file, however many comments touch it.
+        # Files are independent, so their read/fix/write cycles overlap.
+        def fix_file(item):
+            file_path, entries = item
+            return entries, self._apply_file_fixes(file_path, [c for _, c in entries], dry_run)
+        
+        groups = list(by_file.items())
+        if len(groups) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(groups))) as pool:
+                done = list(pool.map(fix_file, groups))
+        else:
+            done = [fix_file(item) for item in groups]
+        
+        for entries, file_results in done:
+            for (slot, _), result in zip(entries, file_results):
+                results[slot] = result
         
         return results
     
-    def _apply_single_fix(self, comment: PRComment, dry_run: bool) -> AppliedFix:
-        """Apply a single fix."""
-        file_path = self.working_dir / comment.file_path
-        
-        if not file_path.exists():
-            return AppliedFix(
-                comment=comment,
-                file_path=str(comment.file_path),
-                success=False,
-                message=f"File not found: {comment.file_path}"
-            )
-        
-        # Read file
+    def _apply_file_fixes(self, file_path: str, comments: List[PRComment], dry_run: bool) -> List[AppliedFix]:
+        """Apply all fixes for one file, returning results in the order of `comments`."""
+        path = self.working_dir / file_path
+        
+        # One stat per file: existence, cache validation and size all come from it
         try:
-            content = file_path.read_text(encoding='utf-8')
-            lines = content.splitlines(keepends=True)
+            key = self._stat_key(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return _failed_fixes(comments, file_path, f"File not found: {file_path}")
         except Exception as e:
-            return AppliedFix(
-                comment=comment,
-                file_path=str(comment.file_path),
-                success=False,
-                message=f"Cannot read file: {e}"
-            )
-        
-        # Determine fix type and apply
-        fix_applied = False
-        fix_message = ""
-        
-        body_lower = comment.body.lower()
-        
-        # var → const/let fix
-        if re.search(r'use\s+(const|let)\s+instead', body_lower):
-            match = re.search(r'use\s+[`\']?(const|let)[`\']?\s+instead', body_lower)
-            if match and comment.line:
-                target_var = match.group(1)
-                line_idx = comment.line - 1
-                if 0 <= line_idx < len(lines):
-                    old_line = lines[line_idx]
-                    new_line = re.sub(r'\b(var|let|const)\b', target_var, old_line, count=1)
-                    if old_line != new_line:
-                        lines[line_idx] = new_line
-                        fix_applied = True
-                        fix_message = f"Changed to `{target_var}`"
-        
-        # Remove extra whitespace
-        elif 'extra' in body_lower and ('space' in body_lower or 'whitespace' in body_lower):
-            if comment.line:
-                line_idx = comment.line - 1
-                if 0 <= line_idx < len(lines):
-                    old_line = lines[line_idx]
-                    new_line = re.sub(r'  +', ' ', old_line)  # Multiple spaces to single
-                    new_line = new_line.rstrip() + '\n' if old_line.endswith('\n') else new_line.rstrip()
-                    if old_line != new_line:
-                        lines[line_idx] = new_line
-                        fix_applied = True
-                        fix_message = "Removed extra whitespace"
-        
-        # Add missing semicolon
-        elif 'missing' in body_lower and 'semicolon' in body_lower:
-            if comment.line:
-                line_idx = comment.line - 1
-                if 0 <= line_idx < len(lines):
-                    old_line = lines[line_idx]
-                    if not old_line.rstrip().endswith((';', '{', '}', ':')):
-                        new_line = old_line.rstrip() + ';\n'
-                        lines[line_idx] = new_line
-                        fix_applied = True
-                        fix_message = "Added semicolon"
-        
-        # Apply GitHub suggestion block
-        elif '```suggestion' in comment.body:
-            suggestion_match = re.search(r'```suggestion\s*\n(.*?)\n```', comment.body, re.DOTALL)
-            if suggestion_match and comment.line:
-                suggestion = suggestion_match.group(1)
-                line_idx = comment.line - 1
-                if 0 <= line_idx < len(lines):
-                    lines[line_idx] = suggestion + '\n'
-                    fix_applied = True
-                    fix_message = "Applied suggestion"
-        
-        # Typo fix
-        elif 'typo' in body_lower:
-            typo_match = re.search(r'[`\'\"](\w+)[`\'\"]\s*(?:→|->|to|should be)\s*[`\'\"](\w+)[`\'\"]', comment.body)
-            if typo_match and comment.line:
-                old_word, new_word = typo_match.groups()
-                line_idx = comment.line - 1
-                if 0 <= line_idx < len(lines):
-                    old_line = lines[line_idx]
-                    new_line = old_line.replace(old_word, new_word)
-                    if old_line != new_line:
-                        lines[line_idx] = new_line
-                        fix_applied = True
-                        fix_message = f"Fixed typo: {old_word} → {new_word}"
-        
-        if not fix_applied:
-            return AppliedFix(
-                comment=comment,
-                file_path=str(comment.file_path),
-                success=False,
-                message="Could not determine how to apply fix"
-            )
+            return _failed_fixes(comments, file_path, f"Cannot read file: {e}")
+        
+        # Fix bottom-up so a multi-line suggestion doesn't shift the lines
+        # that later comments point at
+        ordered = sorted(comments, key=lambda c: c.line or 0, reverse=True)
+        
+        messages: Optional[Dict[int, str]] = None
+        if dry_run and key[1] >= _MMAP_MIN_SIZE and path not in self._file_cache:
+            # Large files in a dry run: only decode the lines being fixed
+            try:
+                messages = self._preview_mapped(path, ordered)
+            except Exception as e:
+                return _failed_fixes(comments, file_path, f"Cannot read file: {e}")
+        
+        if messages is None:
+            # Read file (or reuse the decoded copy if it hasn't changed on disk)
+            try:
+                content = self._read_cached(path, key)
+            except Exception as e:
+                self._file_cache.pop(path, None)
+                return _failed_fixes(comments, file_path, f"Cannot read file: {e}")
+            
+            # Dry runs only report messages, so the new content is never built
+            messages = {}
+            if len(ordered) == 1:
+                result = self._apply_single_fix(ordered[0], content)
+                if result:
+                    start, end, new_line, messages[id(ordered[0])] = result
+                    if not dry_run:
+                        content = content[:start] + new_line + content[end:]
+            else:
+                # Several edits: split once and join once instead of re-slicing
+                # the whole file per fix. read_text() normalises newlines to '\n'.
+                lines = content.split('\n')
+                for comment in ordered:
+                    message = self._apply_line_fix(comment, lines)
+                    if message:
+                        messages[id(comment)] = message
+                if messages and not dry_run:
+                    content = '\n'.join(lines)
         
         # Write changes (if not dry run)
-        if not dry_run:
+        write_error = None
+        if messages and not dry_run:
             try:
-                file_path.write_text(''.join(lines), encoding='utf-8')
+                path.write_text(content, encoding='utf-8')
+                self._file_cache[path] = (self._stat_key(path), content)
             except Exception as e:
-                return AppliedFix(
-                    comment=comment,
-                    file_path=str(comment.file_path),
-                    success=False,
-                    message=f"Failed to write: {e}"
-                )
-        
-        return AppliedFix(
-            comment=comment,
-            file_path=str(comment.file_path),
-            success=True,
-            message=fix_message + (" (dry run)" if dry_run else "")
-        )
+                self._file_cache.pop(path, None)
+                write_error = f"Failed to write: {e}"
+        
+        results = []
+        for comment in comments:
+            message = messages.get(id(comment))
+            if message is None:
+                results.append(AppliedFix(comment=comment, file_path=file_path, success=False,
+                                          message="Could not determine how to apply fix"))
+            elif write_error:
+                results.append(AppliedFix(comment=comment, file_path=file_path, success=False,
+                                          message=write_error))
+            else:
+                results.append(AppliedFix(comment=comment, file_path=file_path, success=True,
+                                          message=message + (" (dry run)" if dry_run else "")))
+        return results
+    
+    def _preview_mapped(self, path: Path, ordered: List[PRComment]) -> Optional[Dict[int, str]]:
+        """
+        Dry-run fixes on a large file through mmap, decoding only the target lines.
+        
+        Returns None when the file should be read normally instead ('\\r'
+        newlines that read_text() would translate).
+        """
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'\r') != -1:
+                return None
+            lines = _mapped_lines(mm, {c.line for c in ordered if c.line and c.line > 0})
+        
+        messages: Dict[int, str] = {}
+        for comment in ordered:
+            text = lines.get(comment.line)
+            if text is None:
+                continue
+            # An earlier suggestion on this line may have expanded it; fix its first line
+            old_line, sep, rest = text.partition('\n')
+            result = _fix_line(comment, old_line)
+            if result:
+                new_line, messages[id(comment)] = result
+                lines[comment.line] = new_line + sep + rest
+        return messages
+    
+    @staticmethod
+    def _stat_key(path: Path) -> Tuple[int, int]:
+        st = path.stat()
+        return st.st_mtime_ns, st.st_size
+    
+    def _read_cached(self, path: Path, key: Tuple[int, int]) -> str:
+        """Return file content, decoding it only when mtime/size (`key`) changed."""
+        cached = self._file_cache.get(path)
+        if cached and cached[0] == key:
+            return cached[1]
+        content = path.read_text(encoding='utf-8')
+        self._file_cache[path] = (key, content)
+        return content
+    
+    def _apply_single_fix(self, comment: PRComment, content: str) -> Optional[Tuple[int, int, str, str]]:
+        """
+        Work out a single fix against file content.
+        
+        Returns (start, end, new_line, message) so the caller can splice
+        new_line over content[start:end], or None.
+        """
+        bounds = _line_bounds(content, comment.line)
+        if not bounds:
+            return None
+        
+        start, end = bounds
+        result = _fix_line(comment, content[start:end])
+        if not result:
+            return None
+        return (start, end) + result
+    
+    def _apply_line_fix(self, comment: PRComment, lines: List[str]) -> Optional[str]:
+        """Apply a single fix in place to the file's '\\n'-split lines. Returns the message or None."""
+        index = (comment.line or 0) - 1
+        # Same bounds as _line_bounds: the empty piece after a trailing newline isn't a line
+        if index < 0 or index >= len(lines) or (index == len(lines) - 1 and not lines[index]):
+            return None
+        
+        # An earlier suggestion on this line may have expanded it; fix its first line
+        old_line, sep, rest = lines[index].partition('\n')
+        result = _fix_line(comment, old_line)
+        if not result:
+            return None
+        new_line, fix_message = result
+        lines[index] = new_line + sep + rest
+        return fix_message
     
     def generate_fix_commit_message(self, fixes: List[AppliedFix]) -> str:
         """Generate commit message for applied fixes."""
-        successful = [f for f in fixes if f.success]
+        first = None
+        count = 0
+        for fix in fixes:
+            if fix.success:
+                count += 1
+                if first is None:
+                    first = fix
         
-        if not successful:
+        if not count:
             return ""
         
-        if len(successful) == 1:
-            return f"fix: {successful[0].message}"
+        if count == 1:
+            return f"fix: {first.message}"
         
-        return f"fix: address {len(successful)} review comments"
+        return f"fix: address {count} review comments"
+
+
+# Singleton, created on first access
+@lru_cache(maxsize=None)
+def _default_auto_fixer() -> AutoFixer:
+    return AutoFixer()
 
 
-# Singleton
-auto_fixer = AutoFixer()
+def __getattr__(name: str):
+    if name == "auto_fixer":
+        return _default_auto_fixer()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,93 @@
+"""On-disk cache for slow remote lookups (Jira issues, GitHub PR data)."""
+
+import functools
+import hashlib
+import os
+import pickle
+import shutil
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+CACHE_DIR = Path.home() / ".agentic" / "cache"
+
+
+def _entry_path(namespace: str, key: str) -> Path:
+    """Cache file for `key` (hashed, so any string is a safe file name)."""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return CACHE_DIR / namespace / f"{digest}.pickle"
+
+
+def load(namespace: str, key: str, ttl: float) -> Optional[Any]:
+    """Return the cached value if it is younger than `ttl` seconds, else None."""
+    path = _entry_path(namespace, key)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        return pickle.loads(path.read_bytes())
+    except Exception:
+        # Missing, unreadable or stale-format entries are just misses
+        return None
+
+
+def store(namespace: str, key: str, value: Any):
+    """Cache `value`; failures only cost the next lookup a round-trip."""
+    path = _entry_path(namespace, key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+def invalidate(namespace: str, key: str):
+    """Drop a single cached entry."""
+    try:
+        _entry_path(namespace, key).unlink()
+    except OSError:
+        pass
+
+
+def clear() -> int:
+    """Remove every cached entry. Returns the number of files removed."""
+    if not CACHE_DIR.exists():
+        return 0
+    count = sum(1 for p in CACHE_DIR.rglob("*") if p.is_file())
+    shutil.rmtree(CACHE_DIR, ignore_errors=True)
+    return count
+
+
+def disk_memoize(ttl: float = 300, scope: Optional[Callable[[], Any]] = None) -> Callable:
+    """
+    Memoize a method's result on disk for `ttl` seconds.
+    
+    The key is the repr of the arguments after `self`, plus `scope()` if
+    given (e.g. the server the result came from). The wrapper gets a
+    `cache_invalidate(*args, **kwargs)` helper to drop one entry, e.g.
+    after the remote object was changed.
+    """
+    def decorator(func: Callable) -> Callable:
+        namespace = func.__qualname__
+        
+        def make_key(args, kwargs) -> str:
+            if scope is not None:
+                return repr((scope(), args, sorted(kwargs.items())))
+            return repr((args, sorted(kwargs.items())))
+        
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = make_key(args, kwargs)
+            cached = load(namespace, key, ttl)
+            if cached is not None:
+                return cached
+            result = func(self, *args, **kwargs)
+            if result is not None:
+                store(namespace, key, result)
+            return result
+        
+        wrapper.cache_invalidate = lambda *args, **kwargs: invalidate(namespace, make_key(args, kwargs))
+        return wrapper
+    
+    return decorator
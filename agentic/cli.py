@@ -17,53 +17,47 @@ Examples:
 
 import sys
 import argparse
+from itertools import chain
 from pathlib import Path
 from typing import Optional
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm
+from ._cli_common import _console, print_banner, print_step, stub_pbi
 
-from .jira_connector import jira_connector, PBIData
-from .enhanced_context_generator import enhanced_context_generator
-from .git_automation import git_automation
-from .todo_manager import todo_manager
-from .pr_review import pr_review_manager, PRReviewSummary
-from .auto_fixer import auto_fixer
+# rich and the workflow modules (Jira, git, PR review) are imported inside
+# the commands that use them, so `--help`, `--version` and argument errors
+# don't pay for loading them.
 
-console = Console()
 
-
-def print_banner():
-    """Print welcome banner."""
-    console.print(Panel.fit(
-        "[bold blue]🚀 Agentic Development Workflow[/bold blue]\n"
-        "[dim]Jira → TDD → PR → Done[/dim]",
-        border_style="blue"
-    ))
-
-
-def print_step(step: int, total: int, message: str, status: str = ""):
-    """Print workflow step."""
-    status_icon = {
-        "": "⏳",
-        "done": "[green]✓[/green]",
-        "skip": "[yellow]○[/yellow]",
-        "error": "[red]✗[/red]",
-        "wait": "[cyan]⏸[/cyan]"
-    }.get(status, "⏳")
-    
-    console.print(f"{status_icon} [{step}/{total}] {message}")
+def __getattr__(name: str):
+    """Keep `agentic.cli.console` working; the console is created on first use."""
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def run_workflow(
     pbi_key: str,
     working_dir: Optional[Path] = None,
     skip_jira: bool = False,
-    draft_pr: bool = False
+    draft_pr: bool = False,
+    context_gen=None
 ):
-    """Run the complete agentic development workflow."""
+    """
+    Run the complete agentic development workflow.
+    
+    `context_gen` replaces the context generator used in step 4; it
+    defaults to the enhanced multi-file generator.
+    """
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+    from .jira_connector import jira_connector, PBIData
+    from .git_automation import git_automation
+    from .parallel import run_parallel
+    
+    console = _console()
+    if context_gen is None:
+        from .enhanced_context_generator import enhanced_context_generator as context_gen
+    
     working_dir = working_dir or Path.cwd()
     total_steps = 7
     
@@ -74,12 +68,20 @@ def run_workflow(
     console.print(f"\n[bold]PBI:[/bold] {pbi_key}")
     console.print(f"[bold]Project:[/bold] {working_dir}\n")
     
-    # Check if working_dir is a git repo
+    # Check if working_dir is a git repo (one local git call), before
+    # anything goes to Jira
     if not git_automation.is_git_repo():
         console.print(f"[red]✗[/red] {working_dir} is not a git repository!")
         console.print("[yellow]Tip: Run this command from your project directory[/yellow]")
         return False
     
+    # Independent lookups: the Jira request overlaps the git call. The
+    # default branch is memoized for create_feature_branch in step 2.
+    tasks = {"default_branch": git_automation.get_default_branch}
+    if not skip_jira:
+        tasks["pbi"] = lambda: jira_connector.fetch_pbi(pbi_key)
+    startup = run_parallel(tasks)
+    
     # ============================================
     # Step 1: Fetch Jira PBI
     # ============================================
@@ -88,22 +90,12 @@ def run_workflow(
     pbi: Optional[PBIData] = None
     if skip_jira:
         print_step(1, total_steps, "Jira fetch skipped", "skip")
-        pbi = PBIData(
-            key=pbi_key,
-            summary="Test PBI Summary",
-            description="Test description",
-            acceptance_criteria=["AC 1", "AC 2", "AC 3"],
-            status="To Do",
-            issue_type="Story",
-            priority="Medium",
-            labels=[],
-            assignee=None,
-            reporter="test@test.com",
-            url=f"https://jira.example.com/browse/{pbi_key}"
-        )
+        pbi = stub_pbi(pbi_key)
     else:
         try:
-            pbi = jira_connector.fetch_pbi(pbi_key)
+            pbi = startup["pbi"]
+            if isinstance(pbi, Exception):
+                raise pbi
             print_step(1, total_steps, f"Fetched: {pbi.summary[:50]}...", "done")
         except Exception as e:
             print_step(1, total_steps, f"Failed to fetch Jira: {e}", "error")
@@ -141,8 +133,10 @@ def run_workflow(
     print_step(4, total_steps, "Generating Copilot context...")
     
     try:
-        context_file = enhanced_context_generator.generate(pbi, working_dir)
-        print_step(4, total_steps, f"Context: {context_file.requirements.relative_to(working_dir)}", "done")
+        context = context_gen.generate(pbi, working_dir)
+        # The enhanced generator returns a bundle of files, simpler ones a single file
+        context_file = getattr(context, "requirements", context)
+        print_step(4, total_steps, f"Context: {context_file.relative_to(working_dir)}", "done")
     except Exception as e:
         print_step(4, total_steps, f"Context generation failed: {e}", "error")
         return False
@@ -150,11 +144,14 @@ def run_workflow(
     # ============================================
     # Step 5: Manual implementation with Copilot
     # ============================================
-    context_dir = context_file.requirements.parent.relative_to(working_dir)
+    if context is context_file:
+        context_entry = context_file.relative_to(working_dir)
+    else:
+        context_entry = f"{context_file.parent.relative_to(working_dir)}/index.md"
     console.print("\n" + "─" * 50)
     console.print(Panel.fit(
         "[bold cyan]🛑 Manual Step: Implement with Copilot[/bold cyan]\n\n"
-        f"1. Open [bold]{context_dir}/index.md[/bold]\n"
+        f"1. Open [bold]{context_entry}[/bold]\n"
         "2. Use Copilot Chat to analyze requirements\n"
         "3. Follow TDD: Write tests first, then implement\n"
         "4. Come back here when ready to create PR",
@@ -227,7 +224,9 @@ def launch_copilot_workflow(pbi_key: str, working_dir: Optional[Path] = None, sk
     """Launch Copilot CLI with Orchestra workflow for a PBI."""
     import subprocess
     import os
+    from rich.panel import Panel
     
+    console = _console()
     working_dir = working_dir or Path.cwd()
     
     console.print(Panel.fit(
@@ -242,6 +241,7 @@ def launch_copilot_workflow(pbi_key: str, working_dir: Optional[Path] = None, sk
         pbi_summary = f"Mock PBI {pbi_key}"
         pbi_description = "Test implementation"
     else:
+        from .jira_connector import jira_connector
         pbi = jira_connector.fetch_pbi(pbi_key)
         if not pbi:
             console.print(f"[red]✗[/red] Could not fetch {pbi_key} from Jira")
@@ -293,7 +293,7 @@ You are an AI development assistant following the **Orchestra TDD Workflow**:
     
     # Step 4: Build the prompt (single line to avoid shell issues)
     prompt = f"Implement {pbi_key}: {pbi_summary}. Follow TDD workflow: 1) Analyze codebase and create plan in plans/{pbi_key.lower()}-plan.md 2) Wait for my approval 3) Implement phase by phase with tests first. Start with planning phase."
-
+    
     # Step 5: Launch copilot CLI
     console.print(f"\n[bold]Launching Copilot CLI...[/bold]")
     console.print(f"[dim]Prompt: {prompt[:80]}...[/dim]\n")
@@ -330,6 +330,34 @@ You are an AI development assistant following the **Orchestra TDD Workflow**:
         sys.exit(1)
 
 
+def run_todo(pbi_key: str, working_dir: Optional[Path] = None, action: str = "show"):
+    """Show or interactively manage the TODO list of a PBI."""
+    from .todo_manager import todo_manager
+    
+    working_dir = working_dir or Path.cwd()
+    if action == "interactive":
+        todo_manager.interactive(pbi_key, working_dir)
+    else:
+        todo_manager.show(pbi_key, working_dir)
+    
+    # show()/interactive() already explain a missing TODO list
+    return todo_manager.get_todo_file(pbi_key, working_dir).exists()
+
+
+class _ClearCacheAction(argparse.Action):
+    """`--clear-cache`: runs during parsing (like --version), so no PBI key is needed."""
+    
+    def __init__(self, option_strings, dest, **kwargs):
+        super().__init__(option_strings, dest, nargs=0, default=argparse.SUPPRESS, **kwargs)
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        from .cache import clear
+        
+        removed = clear()
+        _console().print(f"[green]✓[/green] Cleared {removed} cached entries")
+        parser.exit()
+
+
 def main():
     """Main entry point."""
     # Check for subcommands first
@@ -364,7 +392,7 @@ Examples:
     agentic todo SCRUM-123 -i    # Interactive TODO
     agentic pr review 42         # Analyze PR comments
     agentic pr fix 42 --auto     # Auto-fix PR comments
-    
+
 Config: ~/.agentic/.env or .env in current directory
         """
     )
@@ -399,6 +427,12 @@ Config: ~/.agentic/.env or .env in current directory
         help="Launch Copilot CLI with Orchestra workflow"
     )
     
+    parser.add_argument(
+        "--clear-cache",
+        action=_ClearCacheAction,
+        help="Clear cached Jira/PR data (~/.agentic/cache) and exit"
+    )
+    
     parser.add_argument(
         "--version", "-v",
         action="version",
@@ -428,6 +462,11 @@ Config: ~/.agentic/.env or .env in current directory
 
 def run_pr_review(pr_id: str, working_dir: Optional[Path] = None):
     """Analyze PR comments."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from .pr_review import pr_review_manager
+    
+    console = _console()
     working_dir = working_dir or Path.cwd()
     pr_review_manager.working_dir = working_dir
     pr_review_manager.fetcher.working_dir = working_dir
@@ -443,13 +482,13 @@ def run_pr_review(pr_id: str, working_dir: Optional[Path] = None):
         return False
     
     # Count pending vs already fixed
-    pending_auto = len([c for c in summary.auto_fixable if not c.is_fixed])
-    pending_simple = len([c for c in summary.simple_fixes if not c.is_fixed])
-    pending_complex = len([c for c in summary.complex_fixes if not c.is_fixed])
-    pending_discussions = len([c for c in summary.discussions if not c.is_fixed])
+    parts = summary.partition()
+    pending_auto, auto_fixed = (len(p) for p in parts["auto_fixable"])
+    pending_simple, simple_fixed = (len(p) for p in parts["simple_fixes"])
+    pending_complex, complex_fixed = (len(p) for p in parts["complex_fixes"])
+    pending_discussions, disc_fixed = (len(p) for p in parts["discussions"])
     
-    fixed_count = sum(1 for c in summary.auto_fixable + summary.simple_fixes + 
-                      summary.complex_fixes + summary.discussions if c.is_fixed)
+    fixed_count = auto_fixed + simple_fixed + complex_fixed + disc_fixed
     
     # Show summary table
     table = Table(title=f"PR #{summary.pr_number}: {summary.pr_title[:50]}")
@@ -458,11 +497,6 @@ def run_pr_review(pr_id: str, working_dir: Optional[Path] = None):
     table.add_column("Fixed", justify="right", style="dim")
     table.add_column("Action")
     
-    auto_fixed = len(summary.auto_fixable) - pending_auto
-    simple_fixed = len(summary.simple_fixes) - pending_simple
-    complex_fixed = len(summary.complex_fixes) - pending_complex
-    disc_fixed = len(summary.discussions) - pending_discussions
-    
     table.add_row("🤖 Auto-fixable", str(pending_auto), f"({auto_fixed})", "agentic pr fix --auto")
     table.add_row("🔧 Simple fixes", str(pending_simple), f"({simple_fixed})", "Quick manual fix")
     table.add_row("🔨 Complex fixes", str(pending_complex), f"({complex_fixed})", "Use Copilot")
@@ -493,6 +527,19 @@ def run_pr_review(pr_id: str, working_dir: Optional[Path] = None):
 
 def run_pr_fix(pr_id: str, auto: bool = False, dry_run: bool = False, working_dir: Optional[Path] = None):
     """Fix PR comments - switch to PR branch, apply fix, commit, push, and reply."""
+    from rich.panel import Panel
+    from .pr_review import pr_review_manager
+    from .auto_fixer import auto_fixer
+    from .git_automation import git_automation
+    
+    if auto:
+        # Never prompts, so rich.prompt isn't even imported
+        confirm = lambda *args, **kwargs: True
+    else:
+        from rich.prompt import Confirm
+        confirm = Confirm.ask
+    
+    console = _console()
     working_dir = working_dir or Path.cwd()
     pr_review_manager.working_dir = working_dir
     pr_review_manager.fetcher.working_dir = working_dir
@@ -528,17 +575,15 @@ def run_pr_fix(pr_id: str, auto: bool = False, dry_run: bool = False, working_di
     if not summary:
         return False
     
-    # Filter out already-fixed comments
-    pending_auto = [c for c in summary.auto_fixable if not c.is_fixed]
-    pending_simple = [c for c in summary.simple_fixes if not c.is_fixed]
+    # Split off already-fixed comments
+    parts = summary.partition()
+    pending_auto, skipped_auto = parts["auto_fixable"]
+    pending_simple, skipped_simple = parts["simple_fixes"]
     
     # Show skipped (already fixed) comments
-    skipped_auto = [c for c in summary.auto_fixable if c.is_fixed]
-    skipped_simple = [c for c in summary.simple_fixes if c.is_fixed]
-    
     if skipped_auto or skipped_simple:
         console.print(f"\n[dim]Skipped (already fixed): {len(skipped_auto) + len(skipped_simple)} comments[/dim]")
-        for c in skipped_auto + skipped_simple:
+        for c in chain(skipped_auto, skipped_simple):
             console.print(f"  [dim]• {c.file_path}:{c.line} - already replied[/dim]")
     
     if not pending_auto and not pending_simple:
@@ -550,9 +595,8 @@ def run_pr_fix(pr_id: str, auto: bool = False, dry_run: bool = False, working_di
     for c in pending_auto:
         console.print(f"  • {c.file_path}:{c.line} - {c.suggested_fix or c.body[:50]}")
     
-    if not auto:
-        if not Confirm.ask("\nApply these fixes?"):
-            return False
+    if not confirm("\nApply these fixes?"):
+        return False
     
     # Apply fixes (only pending ones)
     fixes = auto_fixer.apply_fixes(pending_auto, dry_run=dry_run)
@@ -568,7 +612,7 @@ def run_pr_fix(pr_id: str, auto: bool = False, dry_run: bool = False, working_di
         # Auto commit and push
         commit_msg = auto_fixer.generate_fix_commit_message(fixes)
         
-        if auto or Confirm.ask("\nCommit and push fixes?"):
+        if confirm("\nCommit and push fixes?"):
             # Stage and commit
             git_automation.commit_changes(f"PR-{pr_id}", commit_msg)
             
@@ -577,16 +621,18 @@ def run_pr_fix(pr_id: str, auto: bool = False, dry_run: bool = False, working_di
                 console.print(f"[green]✓[/green] Fixes committed and pushed to {pr_branch}")
                 
                 # Reply to PR comments
-                if auto or Confirm.ask("Reply to PR comments?"):
+                if confirm("Reply to PR comments?"):
                     commit_hash = git_automation.get_last_commit_hash()
-                    for fix in successful:
-                        reply_body = f"Fixed in commit {commit_hash}: {fix.message}"
-                        pr_review_manager.fetcher.reply_to_comment(
-                            int(pr_id), 
-                            fix.comment.id, 
-                            reply_body
-                        )
-                    console.print(f"[green]✓[/green] Replied to {len(successful)} comments")
+                    replies = [
+                        (fix.comment, f"Fixed in commit {commit_hash}: {fix.message}")
+                        for fix in successful
+                    ]
+                    posted = pr_review_manager.fetcher.reply_to_comments_batch(
+                        int(pr_id),
+                        replies,
+                        pr_info.get("id")
+                    )
+                    console.print(f"[green]✓[/green] Replied to {sum(posted)} comments")
             else:
                 console.print("[red]✗[/red] Failed to push")
     
@@ -595,6 +641,7 @@ def run_pr_fix(pr_id: str, auto: bool = False, dry_run: bool = False, working_di
 
 def handle_pr_command():
     """Handle pr subcommand."""
+    console = _console()
     if len(sys.argv) < 3:
         console.print("Usage: agentic pr <review|fix> <PR>")
         sys.exit(1)
@@ -631,7 +678,9 @@ def handle_init_command():
     """Handle init subcommand - copy agent files to project or global location."""
     import shutil
     import os
+    from rich.panel import Panel
     
+    console = _console()
     parser = argparse.ArgumentParser(
         prog="agentic init",
         description="Initialize Orchestra agents for the current project"
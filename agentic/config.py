@@ -1,13 +1,26 @@
 """Configuration settings for the agentic workflow."""
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from dotenv import load_dotenv
 
 # Load .env from user's home directory or current directory
+@lru_cache(maxsize=None)
 def _load_config():
     """Load .env from multiple possible locations."""
+    # Environment already configured (CI, containers): skip python-dotenv
+    if os.environ.get("AGENTIC_SKIP_DOTENV"):
+        return None
+    
+    from dotenv import load_dotenv
+    
+    # A parent process that already resolved the file passes it down
+    cached = os.environ.get("_AGENTIC_ENV_PATH")
+    if cached and os.path.isfile(cached):
+        load_dotenv(cached)
+        return Path(cached)
+    
     # Priority: current dir > home dir > package dir
     locations = [
         Path.cwd() / ".env",
@@ -16,8 +29,9 @@ def _load_config():
     ]
     
     for loc in locations:
-        if loc.exists():
+        if os.path.isfile(loc):
             load_dotenv(loc)
+            os.environ["_AGENTIC_ENV_PATH"] = str(loc)
             return loc
     
     load_dotenv()  # Try default
@@ -26,35 +40,63 @@ def _load_config():
 _config_path = _load_config()
 
 
-@dataclass
+def _env(name: str, default: str = ""):
+    """Dataclass default read from the environment when the config is created."""
+    return field(default_factory=lambda: os.getenv(name, default))
+
+
+@dataclass(frozen=True, slots=True)
 class JiraConfig:
     """Jira connection and workflow configuration."""
-    server: str = os.getenv("JIRA_SERVER", "")
-    email: str = os.getenv("JIRA_EMAIL", "")
-    api_token: str = os.getenv("JIRA_API_TOKEN", "")
+    server: str = _env("JIRA_SERVER")
+    email: str = _env("JIRA_EMAIL")
+    api_token: str = _env("JIRA_API_TOKEN")
     
     # Workflow status mapping
-    status_todo: str = os.getenv("JIRA_STATUS_TODO", "To Do")
-    status_in_progress: str = os.getenv("JIRA_STATUS_IN_PROGRESS", "In Progress")
-    status_in_review: str = os.getenv("JIRA_STATUS_IN_REVIEW", "In Review")
-    status_done: str = os.getenv("JIRA_STATUS_DONE", "Done")
+    status_todo: str = _env("JIRA_STATUS_TODO", "To Do")
+    status_in_progress: str = _env("JIRA_STATUS_IN_PROGRESS", "In Progress")
+    status_in_review: str = _env("JIRA_STATUS_IN_REVIEW", "In Review")
+    status_done: str = _env("JIRA_STATUS_DONE", "Done")
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GitConfig:
     """Git and GitHub configuration."""
-    repo: str = os.getenv("GITHUB_REPO", "")
+    repo: str = _env("GITHUB_REPO")
     branch_prefix: str = "feature"
     
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class WorkflowConfig:
     """Main workflow configuration."""
     context_dir: str = ".copilot"
     context_file: str = "context.md"
 
 
-# Global config instances
-jira_config = JiraConfig()
-git_config = GitConfig()
-workflow_config = WorkflowConfig()
+@lru_cache(maxsize=1)
+def get_jira_config() -> JiraConfig:
+    return JiraConfig()
+
+
+@lru_cache(maxsize=1)
+def get_git_config() -> GitConfig:
+    return GitConfig()
+
+
+@lru_cache(maxsize=1)
+def get_workflow_config() -> WorkflowConfig:
+    return WorkflowConfig()
+
+
+# Global config instances, created on first access
+_CONFIG_GETTERS = {
+    "jira_config": get_jira_config,
+    "git_config": get_git_config,
+    "workflow_config": get_workflow_config,
+}
+
+
+def __getattr__(name: str):
+    if name in _CONFIG_GETTERS:
+        return _CONFIG_GETTERS[name]()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
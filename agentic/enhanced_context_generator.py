@@ -1,15 +1,106 @@
 """Enhanced context generator with multi-file support."""
 
 import json
+import os
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
-from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+from dataclasses import dataclass
 
 from .config import workflow_config
-from .jira_connector import PBIData
 
+if TYPE_CHECKING:
+    # Annotations only; jira_connector brings in rich, which todo_manager
+    # (importing _write_file from here) doesn't otherwise need
+    from .jira_connector import PBIData
 
-@dataclass
+
+@lru_cache(maxsize=128)
+def _ensure_dir(path: str):
+    """mkdir -p, at most once per directory per process."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+
+
+def _write_file(item: tuple[Path, str]) -> bool:
+    """
+    Write through a temp file so readers never see a half-written file.
+    
+    Files whose content is unchanged are left alone, so reruns don't touch
+    mtimes (editor file watchers, git status). Returns True if written.
+    """
+    path, content = item
+    data = content.encode('utf-8')
+    try:
+        if path.read_bytes() == data:
+            return False
+    except OSError:
+        pass
+    
+    # Raw fd: one encode up front, no text-layer buffering or newline translation
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+    os.replace(tmp, path)
+    return True
+
+
+# todo.md around the sections
+_MD_HEADER = "# ✅ TODO: {pbi_key}\n\n> **{summary}**\n"
+_MD_FOOTER = "\n---\n**Progress:** {done}/{total} ({pct}%)\n"
+
+# todo.md sections, in order: (category, heading)
+_MD_SECTIONS = (
+    ("requirement", "📋 Requirements"),
+    ("test", "🧪 Tests"),
+    ("implementation", "🔨 Implementation"),
+    ("general", "📝 General")
+)
+
+
+def _render_todo_markdown(pbi_key: str, summary: str, todos: list[dict]) -> str:
+    """
+    todo.md for a todo list as stored in todo.json.
+    
+    The single renderer for the file: the generator writes the first
+    version and TodoManager rewrites it on every status change.
+    """
+    # One pass: checklist lines per category plus the done count
+    buckets = defaultdict(list)
+    done_count = 0
+    for t in todos:
+        status = t["status"]
+        check = "x" if status == "done" else " "
+        prefix = "🔄 " if status == "in_progress" else ""
+        buckets[t["category"]].append(f"\n- [{check}] {prefix}{t['title']}")
+        done_count += status == "done"
+    
+    total = len(todos)
+    pct = int(done_count / total * 100) if total > 0 else 0
+    
+    # Collect every piece, then a single join
+    parts = [_MD_HEADER.format(pbi_key=pbi_key, summary=summary)]
+    for cat, name in _MD_SECTIONS:
+        if cat in buckets:
+            parts.append(f"\n## {name}")
+            parts += buckets[cat]
+        parts.append("\n")
+    parts.append(_MD_FOOTER.format(done=done_count, total=total, pct=pct))
+    return "".join(parts)
+
+
+# Everything str.isalnum() rejects except spaces (\w also admits '_')
+_NON_ALNUM_RE = re.compile(r'[^\w ]|_')
+
+
+@dataclass(slots=True, frozen=True)
 class ContextFiles:
     """Generated context file paths."""
     requirements: Path
@@ -19,21 +110,14 @@ class ContextFiles:
     test_skeleton: Optional[Path] = None
 
 
-@dataclass 
-class TodoItem:
-    """Interactive todo item."""
-    id: int
-    title: str
-    status: str = "pending"
-    category: str = "general"
-    
-    def to_dict(self):
-        return {
-            "id": self.id,
-            "title": self.title,
-            "status": self.status,
-            "category": self.category
-        }
+@dataclass(slots=True, frozen=True)
+class _ACInfo:
+    """An acceptance criterion with the derived strings the generators need."""
+    index: int
+    text: str
+    short35: str
+    short40: str
+    test_name: str
 
 
 class EnhancedContextGenerator:
@@ -42,27 +126,50 @@ class EnhancedContextGenerator:
     def __init__(self, output_dir: Optional[str] = None):
         self.output_dir = Path(output_dir or workflow_config.context_dir)
     
-    def generate(self, pbi: PBIData, working_dir: Path) -> ContextFiles:
+    def generate(self, pbi: "PBIData", working_dir: Path) -> ContextFiles:
         """Generate all context files."""
         context_dir = working_dir / self.output_dir / pbi.key
-        context_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(str(context_dir))
+        
+        # Render everything first, then write all files concurrently
+        acs = self._prep_ac(pbi)
+        todos = self._build_todos(acs)
+        requirements = self._generate_requirements(pbi, context_dir)
+        tests = self._generate_tests(pbi, context_dir, acs)
+        implementation = self._generate_implementation(pbi, context_dir)
+        todo = self._generate_todo(pbi, context_dir, todos)
+        writes = [requirements, tests, implementation, todo,
+                  self._generate_todo_markdown(pbi, context_dir, todos)]
+        
+        test_skeleton, skeleton_writes = self._generate_test_skeleton(pbi, working_dir, acs)
+        writes += skeleton_writes
+        writes.append(self._generate_index(pbi, context_dir, test_skeleton))
         
-        requirements_file = self._generate_requirements(pbi, context_dir)
-        tests_file = self._generate_tests(pbi, context_dir)
-        implementation_file = self._generate_implementation(pbi, context_dir)
-        todo_file = self._generate_todo(pbi, context_dir)
-        test_skeleton = self._generate_test_skeleton(pbi, working_dir)
-        self._generate_index(pbi, context_dir, test_skeleton)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(_write_file, writes))
         
         return ContextFiles(
-            requirements=requirements_file,
-            tests=tests_file,
-            implementation=implementation_file,
-            todo=todo_file,
+            requirements=requirements[0],
+            tests=tests[0],
+            implementation=implementation[0],
+            todo=todo[0],
             test_skeleton=test_skeleton
         )
     
-    def _generate_requirements(self, pbi: PBIData, context_dir: Path) -> Path:
+    def _prep_ac(self, pbi: "PBIData") -> list[_ACInfo]:
+        """Derive truncations and test names once per AC."""
+        return [
+            _ACInfo(
+                index=i,
+                text=ac,
+                short35=ac[:35] + "..." if len(ac) > 35 else ac,
+                short40=ac[:40] + "..." if len(ac) > 40 else ac,
+                test_name=self._ac_to_test_name(ac)
+            )
+            for i, ac in enumerate(pbi.acceptance_criteria or [], 1)
+        ]
+    
+    def _generate_requirements(self, pbi: "PBIData", context_dir: Path) -> tuple[Path, str]:
         file_path = context_dir / "requirements.md"
         ac_list = "\n".join(f"- [ ] {ac}" for ac in pbi.acceptance_criteria) if pbi.acceptance_criteria else "_No AC found._"
         labels = ", ".join(f"`{label}`" for label in pbi.labels) if pbi.labels else "_None_"
@@ -90,12 +197,11 @@ class EnhancedContextGenerator:
 @workspace Analyze #file:{pbi.key}/requirements.md and suggest implementation approach
 ```
 '''
-        file_path.write_text(content, encoding='utf-8')
-        return file_path
+        return file_path, content
     
-    def _generate_tests(self, pbi: PBIData, context_dir: Path) -> Path:
+    def _generate_tests(self, pbi: "PBIData", context_dir: Path, acs: list[_ACInfo]) -> tuple[Path, str]:
         file_path = context_dir / "tests.md"
-        test_cases = self._generate_test_cases(pbi)
+        test_cases = self._generate_test_cases(acs)
         
         content = f'''# 🧪 Test Plan: {pbi.key}
 
@@ -114,25 +220,22 @@ class EnhancedContextGenerator:
 @workspace Based on #file:{pbi.key}/tests.md generate pytest tests
 ```
 '''
-        file_path.write_text(content, encoding='utf-8')
-        return file_path
+        return file_path, content
     
-    def _generate_test_cases(self, pbi: PBIData) -> str:
-        if not pbi.acceptance_criteria:
+    def _generate_test_cases(self, acs: list[_ACInfo]) -> str:
+        if not acs:
             return "| # | Test Case | Priority |\n|---|-----------|----------|\n| 1 | _Define tests_ | High |"
         
         rows = ["| # | Test Case | AC | Priority |", "|---|-----------|-------|----------|"]
-        for i, ac in enumerate(pbi.acceptance_criteria, 1):
-            test_name = self._ac_to_test_name(ac)
-            short_ac = ac[:40] + "..." if len(ac) > 40 else ac
-            rows.append(f"| {i} | `{test_name}` | {short_ac} | {'High' if i <= 3 else 'Medium'} |")
+        for ac in acs:
+            rows.append(f"| {ac.index} | `{ac.test_name}` | {ac.short40} | {'High' if ac.index <= 3 else 'Medium'} |")
         return "\n".join(rows)
     
     def _ac_to_test_name(self, ac: str) -> str:
-        clean = ''.join(c if c.isalnum() or c == ' ' else '' for c in ac.lower())
+        clean = _NON_ALNUM_RE.sub('', ac.lower())
         return f"test_{'_'.join(clean.split()[:5])}"
     
-    def _generate_implementation(self, pbi: PBIData, context_dir: Path) -> Path:
+    def _generate_implementation(self, pbi: "PBIData", context_dir: Path) -> tuple[Path, str]:
         file_path = context_dir / "implementation.md"
         content = f'''# 🔨 Implementation: {pbi.key}
 
@@ -153,83 +256,58 @@ class EnhancedContextGenerator:
 @workspace Implement {pbi.key} based on #file:{pbi.key}/requirements.md
 ```
 '''
-        file_path.write_text(content, encoding='utf-8')
-        return file_path
+        return file_path, content
     
-    def _generate_todo(self, pbi: PBIData, context_dir: Path) -> Path:
-        file_path = context_dir / "todo.json"
-        todos = []
-        todo_id = 1
-        
-        todos.append(TodoItem(todo_id, "Review requirements", "pending", "requirement").to_dict()); todo_id += 1
-        todos.append(TodoItem(todo_id, "Analyze scope", "pending", "requirement").to_dict()); todo_id += 1
+    def _build_todos(self, acs: list[_ACInfo]) -> list[dict]:
+        tasks = [("Review requirements", "requirement"), ("Analyze scope", "requirement")]
         
-        ac_list = pbi.acceptance_criteria or []
-        for ac in ac_list[:5]:
-            short = ac[:35] + "..." if len(ac) > 35 else ac
-            todos.append(TodoItem(todo_id, f"Test: {short}", "pending", "test").to_dict()); todo_id += 1
-        
-        todos.append(TodoItem(todo_id, "Implement feature", "pending", "implementation").to_dict()); todo_id += 1
-        todos.append(TodoItem(todo_id, "Handle edge cases", "pending", "implementation").to_dict()); todo_id += 1
-        todos.append(TodoItem(todo_id, "Refactor", "pending", "implementation").to_dict()); todo_id += 1
+        for ac in acs[:5]:
+            tasks.append((f"Test: {ac.short35}", "test"))
         
+        tasks += [
+            ("Implement feature", "implementation"),
+            ("Handle edge cases", "implementation"),
+            ("Refactor", "implementation"),
+        ]
+        return [
+            {"id": i, "title": title, "status": "pending", "category": category}
+            for i, (title, category) in enumerate(tasks, 1)
+        ]
+    
+    def _generate_todo(self, pbi: "PBIData", context_dir: Path, todos: list[dict]) -> tuple[Path, str]:
+        file_path = context_dir / "todo.json"
         data = {"pbi_key": pbi.key, "summary": pbi.summary, "todos": todos}
-        file_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
-        
-        # Also generate markdown
-        self._generate_todo_markdown(pbi, context_dir, todos)
-        return file_path
+        # Machine-read by `agentic todo`; compact is smaller and faster to dump
+        return file_path, json.dumps(data, separators=(",", ":"))
     
-    def _generate_todo_markdown(self, pbi: PBIData, context_dir: Path, todos: list):
-        file_path = context_dir / "todo.md"
-        
-        def render(items, cat):
-            filtered = [t for t in items if t["category"] == cat]
-            return "\n".join(f"- [ ] {t['title']}" for t in filtered)
-        
-        content = f'''# ✅ TODO: {pbi.key}
-
-> **{pbi.summary}**
-
-## 📋 Requirements
-{render(todos, "requirement")}
-
-## 🧪 Tests
-{render(todos, "test")}
-
-## 🔨 Implementation
-{render(todos, "implementation")}
-
----
-Progress: 0/{len(todos)} (0%)
-'''
-        file_path.write_text(content, encoding='utf-8')
+    def _generate_todo_markdown(self, pbi: "PBIData", context_dir: Path, todos: list[dict]) -> tuple[Path, str]:
+        return context_dir / "todo.md", _render_todo_markdown(pbi.key, pbi.summary, todos)
     
-    def _generate_test_skeleton(self, pbi: PBIData, working_dir: Path) -> Optional[Path]:
+    def _generate_test_skeleton(self, pbi: "PBIData", working_dir: Path, acs: list[_ACInfo]) -> tuple[Optional[Path], list[tuple[Path, str]]]:
+        """Returns the test file path and the (path, content) pairs still to write."""
         tests_dir = working_dir / "tests"
-        tests_dir.mkdir(exist_ok=True)
+        _ensure_dir(str(tests_dir))
         
+        writes = []
         init_file = tests_dir / "__init__.py"
         if not init_file.exists():
-            init_file.write_text("", encoding='utf-8')
+            writes.append((init_file, ""))
         
         test_file = tests_dir / f"test_{pbi.key.lower().replace('-', '_')}.py"
         
         # Skip if test file already exists (don't overwrite user's tests)
         if test_file.exists():
-            return test_file
+            return test_file, writes
         
         test_funcs = []
-        ac_list = pbi.acceptance_criteria or []
-        for i, ac in enumerate(ac_list[:5], 1):
-            func_name = self._ac_to_test_name(ac)
+        for ac in acs[:5]:
             test_funcs.append(f'''
-def {func_name}():
-    """AC {i}: {ac[:60]}"""
+def {ac.test_name}():
+    """AC {ac.index}: {ac.text[:60]}"""
     # TODO: Implement
     pytest.skip("Not implemented")
 ''')
-        
+
         placeholder = 'def test_placeholder():\n    pytest.skip("Add tests")'
         tests_code = "".join(test_funcs) if test_funcs else placeholder
         content = f'''"""Tests for {pbi.key}: {pbi.summary}"""
@@ -237,10 +315,10 @@ import pytest
 
 {tests_code}
 '''
-        test_file.write_text(content, encoding='utf-8')
-        return test_file
+        writes.append((test_file, content))
+        return test_file, writes
     
-    def _generate_index(self, pbi: PBIData, context_dir: Path, test_skeleton: Optional[Path]):
+    def _generate_index(self, pbi: "PBIData", context_dir: Path, test_skeleton: Optional[Path]) -> tuple[Path, str]:
         file_path = context_dir / "index.md"
         content = f'''# 🚀 {pbi.key}: {pbi.summary}
 
@@ -258,7 +336,16 @@ import pytest
 
 **Jira:** [{pbi.key}]({pbi.url})
 '''
-        file_path.write_text(content, encoding='utf-8')
+        return file_path, content
+
+
+@lru_cache(maxsize=None)
+def _default_generator() -> EnhancedContextGenerator:
+    return EnhancedContextGenerator()
 
 
-enhanced_context_generator = EnhancedContextGenerator()
+def __getattr__(name: str):
+    """Create `enhanced_context_generator` on first use, not at import."""
+    if name == "enhanced_context_generator":
+        return _default_generator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
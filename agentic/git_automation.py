@@ -1,16 +1,137 @@
 """Git and GitHub PR automation using gh CLI."""
 
+import atexit
 import subprocess
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
+from functools import lru_cache
 
 from rich.console import Console
 
+from ._cli_common import plain_printer
 from .config import git_config
 from .jira_connector import PBIData
 
 console = Console()
+_print = plain_printer(console)
+
+
+class _BranchKeyTable(dict):
+    """
+    str.translate table: ASCII letters, digits and '-' map to themselves,
+    anything else (including non-ASCII) becomes '-'.
+    """
+    
+    def __missing__(self, codepoint: int) -> int:
+        return 0x2D  # '-'
+
+
+# ASCII alnum and '-' kept; the rest become '-' via __missing__
+_BRANCH_KEY_TABLE = _BranchKeyTable(
+    (ord(c), ord(c))
+    for c in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-"
+)
+
+# "[branch abc1234] message" / "[branch (root-commit) abc1234] message"
+_COMMIT_SUMMARY_RE = re.compile(r'^\[[^\]]*?([0-9a-f]{7,})\]', re.MULTILINE)
+
+# Working dirs already fetched from origin in this process
+_fetched: set[Path] = set()
+
+_PR_BODY_TEMPLATE = '''## 📋 Summary
+
+{summary}
+
+**Jira:** [{key}]({url})  
+**Type:** {issue_type} | **Priority:** {priority}
+
+---
+
+## 📝 Description
+
+{description}
+
+---
+
+## ✅ Acceptance Criteria
+
+{ac_checklist}
+
+---
+
+## 🧪 Testing
+
+- [ ] Unit tests added/updated
+- [ ] All tests passing
+- [ ] Manual testing completed
+
+---
+
+_This PR was created by Agentic Workflow Tool_
+'''
+
+
+class _GitDaemon:
+    """
+    Long-running `git cat-file --batch-check` for revision lookups.
+    
+    Queries go over a pipe to one git process instead of spawning
+    `git rev-parse` per question. Read-only; mutations stay one-shot.
+    """
+    
+    def __init__(self, working_dir: str):
+        self.working_dir = working_dir
+        self._proc: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+    
+    def resolve(self, rev: str) -> Optional[str]:
+        """Full object id of `rev`, or None if it doesn't resolve."""
+        with self._lock:
+            try:
+                if self._proc is None:
+                    self._proc = subprocess.Popen(
+                        ["git", "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+                        cwd=self.working_dir,
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                        text=True,
+                        encoding='utf-8'
+                    )
+                    # Only while the process runs; a replaced daemon drops out
+                    atexit.register(self.close)
+                self._proc.stdin.write(rev + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except (OSError, ValueError):
+                line = ""
+            
+            if not line:
+                # git isn't installed or this isn't a repository
+                self._close_locked()
+                return None
+        
+        # "<oid> <type>", or "<rev> missing"
+        oid, _, kind = line.strip().partition(" ")
+        return oid if kind and kind != "missing" else None
+    
+    def close(self):
+        with self._lock:
+            self._close_locked()
+    
+    def _close_locked(self):
+        if self._proc is None:
+            return
+        atexit.unregister(self.close)
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=5)
+        except (OSError, ValueError, subprocess.TimeoutExpired):
+            self._proc.kill()
+        self._proc = None
 
 
 class GitAutomation:
@@ -18,138 +139,239 @@ class GitAutomation:
     
     def __init__(self, working_dir: Optional[Path] = None):
         self.working_dir = working_dir or Path.cwd()
+        # cwd for subprocess, converted once instead of on every call
+        self._cwd = str(self.working_dir)
+        self._daemon: Optional[_GitDaemon] = None
+        self._git_dir: Optional[Path] = None
+        # working dir -> default branch; it doesn't change during a run
+        self._default_branch_cache: dict[Path, str] = {}
+        # Set once `gh auth status` succeeded; cleared when gh reports an auth error
+        self._gh_auth_ok = False
+        # (working dir, command) -> result of read-only git queries
+        self._query_cache: dict[tuple[str, tuple[str, ...]], Tuple[bool, str]] = {}
     
     def set_working_dir(self, path: Path):
         """Update working directory."""
         self.working_dir = path
+        self._cwd = str(path)
+        if self._daemon:
+            self._daemon.close()
+        self._daemon = None
+        self._git_dir = None
+        self._invalidate_queries()
     
-    def _run_command(self, cmd: list[str], check: bool = True) -> Tuple[bool, str]:
-        """Run a shell command."""
+    def _invalidate_queries(self):
+        """Forget cached query results after anything that changes the repo."""
+        self._query_cache.clear()
+    
+    def _cached_run_command(self, cmd: list[str]) -> Tuple[bool, str]:
+        """_run_command for read-only queries whose answer only changes when we change the repo."""
+        key = (self._cwd, tuple(cmd))
+        if key not in self._query_cache:
+            self._query_cache[key] = self._run_command(cmd, check=False)
+        return self._query_cache[key]
+    
+    def _resolve(self, rev: str) -> Optional[str]:
+        """Resolve a revision through the persistent cat-file process."""
+        if self._daemon is None:
+            self._daemon = _GitDaemon(self._cwd)
+        return self._daemon.resolve(rev)
+    
+    def _get_git_dir(self) -> Optional[Path]:
+        """Absolute .git directory (per worktree), looked up once."""
+        if self._git_dir is None:
+            success, output = self._run_command(["git", "rev-parse", "--absolute-git-dir"], check=False)
+            if success and output:
+                self._git_dir = Path(output)
+        return self._git_dir
+    
+    def _run_command(self, cmd: list[str], check: bool = True, input: Optional[str] = None) -> Tuple[bool, str]:
+        """Run a shell command, optionally feeding `input` to its stdin."""
+        # Raw bytes + one explicit decode: git and gh always speak UTF-8, so
+        # skip the locale-aware text wrapper subprocess would set up
         try:
             result = subprocess.run(
                 cmd,
-                cwd=self.working_dir,
+                cwd=self._cwd,
+                input=input.encode('utf-8') if input is not None else None,
                 capture_output=True,
-                text=True,
                 check=check
             )
-            return True, result.stdout.strip()
+            return True, result.stdout.decode('utf-8', 'replace').strip()
         except subprocess.CalledProcessError as e:
-            return False, e.stderr.strip() or str(e)
+            return False, e.stderr.decode('utf-8', 'replace').strip() or str(e)
         except FileNotFoundError:
             return False, f"Command not found: {cmd[0]}"
     
+    def _exit_code(self, cmd: list[str]) -> int:
+        """Run a command for its exit status only (-1 if it can't be run)."""
+        try:
+            return subprocess.run(
+                cmd,
+                cwd=self._cwd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            ).returncode
+        except FileNotFoundError:
+            return -1
+    
     def check_gh_cli(self) -> bool:
         """Check if gh CLI is installed and authenticated."""
-        success, output = self._run_command(["gh", "auth", "status"], check=False)
+        # Only successes are cached; a failure is re-checked next time
+        if self._gh_auth_ok:
+            return True
+        
+        success, output = self._run_command(["gh", "auth", "status"])
         if not success:
-            console.print("[red]✗[/red] GitHub CLI not authenticated. Run: gh auth login")
+            _print("[red]✗[/red] GitHub CLI not authenticated. Run: gh auth login")
             return False
+        self._gh_auth_ok = True
         return True
     
     def is_git_repo(self) -> bool:
         """Check if working directory is a git repository."""
-        success, _ = self._run_command(["git", "rev-parse", "--git-dir"], check=False)
-        return success
+        # Shares the cached git dir lookup used by get_current_branch
+        return self._get_git_dir() is not None
     
     def get_current_branch(self) -> str:
-        """Get current git branch name."""
+        """Get current git branch name ("" when HEAD is detached)."""
+        # HEAD is always a loose file, so read it instead of running git
+        git_dir = self._get_git_dir()
+        if git_dir:
+            try:
+                head = (git_dir / "HEAD").read_text(encoding='utf-8').strip()
+                return head[len("ref: refs/heads/"):] if head.startswith("ref: refs/heads/") else ""
+            except OSError:
+                pass
+        
         success, output = self._run_command(["git", "branch", "--show-current"])
         return output if success else "unknown"
     
     def get_last_commit_hash(self, short: bool = True) -> str:
         """Get the last commit hash."""
-        cmd = ["git", "rev-parse", "--short", "HEAD"] if short else ["git", "rev-parse", "HEAD"]
-        success, output = self._run_command(cmd)
-        return output if success else "unknown"
+        oid = self._resolve("HEAD")
+        if not oid:
+            return "unknown"
+        if not short:
+            return oid
+        # git lengthens the abbreviation where 7 characters would be ambiguous;
+        # keyed by object id, so it's asked once per commit
+        success, output = self._cached_run_command(["git", "rev-parse", "--short", oid])
+        return output if success and output else oid[:7]
     
     def get_default_branch(self) -> str:
         """Get the default branch (main or master)."""
-        success, output = self._run_command(
-            ["git", "symbolic-ref", "refs/remotes/origin/HEAD", "--short"],
-            check=False
-        )
+        if self.working_dir in self._default_branch_cache:
+            return self._default_branch_cache[self.working_dir]
+        
+        branch = self._find_default_branch()
+        self._default_branch_cache[self.working_dir] = branch
+        return branch
+    
+    def _find_default_branch(self) -> str:
+        # One spawn answers both questions: where origin/HEAD points (%(symref))
+        # and which of main/master exist locally
+        success, output = self._run_command([
+            "git", "for-each-ref", "--format=%(refname) %(symref)",
+            "refs/remotes/origin/HEAD", "refs/heads/main", "refs/heads/master"
+        ])
+        refs = {}
         if success:
-            return output.replace("origin/", "")
+            for line in output.splitlines():
+                refname, _, target = line.partition(" ")
+                refs[refname] = target
+        
+        origin_head = refs.get("refs/remotes/origin/HEAD", "")
+        if origin_head.startswith("refs/remotes/origin/"):
+            return origin_head[len("refs/remotes/origin/"):]
         
         for branch in ["main", "master"]:
-            success, _ = self._run_command(
-                ["git", "show-ref", "--verify", f"refs/heads/{branch}"],
-                check=False
-            )
-            if success:
+            if f"refs/heads/{branch}" in refs:
                 return branch
         
         return "main"
     
-    def create_feature_branch(self, pbi_key: str) -> Tuple[bool, str]:
+    def fetch_origin(self, force: bool = False):
+        """`git fetch origin`, at most once per working dir unless forced."""
+        if force or self.working_dir not in _fetched:
+            self._run_command(["git", "fetch", "origin"], check=False)
+            _fetched.add(self.working_dir)
+    
+    def create_feature_branch(self, pbi_key: str, force_fetch: bool = False) -> Tuple[bool, str]:
         """Create and checkout a new feature branch."""
-        safe_key = re.sub(r'[^a-zA-Z0-9-]', '-', pbi_key)
+        safe_key = pbi_key.translate(_BRANCH_KEY_TABLE)
         branch_name = f"{git_config.branch_prefix}/{safe_key}"
         
-        self._run_command(["git", "fetch", "origin"], check=False)
-        
-        default_branch = self.get_default_branch()
-        
-        success, error = self._run_command(["git", "checkout", default_branch], check=False)
-        if success:
-            self._run_command(["git", "pull", "origin", default_branch], check=False)
-        
-        success, error = self._run_command(
-            ["git", "checkout", "-b", branch_name],
-            check=False
-        )
+        # The fetch is network-bound, so answer the local, read-only
+        # questions while it runs. origin/* refs are read only after it.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            fetch = pool.submit(self.fetch_origin, force_fetch)
+            exists = self._resolve(f"refs/heads/{branch_name}") is not None
+            default_branch = self.get_default_branch()
+            fetch.result()
+        self._invalidate_queries()
         
-        if not success:
-            success, error = self._run_command(
-                ["git", "checkout", branch_name],
-                check=False
-            )
+        if exists:
+            success, error = self._run_command(["git", "checkout", branch_name])
             if success:
-                console.print(f"[yellow]![/yellow] Branch {branch_name} already exists, switched to it")
+                _print(f"[yellow]![/yellow] Branch {branch_name} already exists, switched to it")
                 return True, branch_name
+        else:
+            # Branch straight off the just-fetched remote tip: no checkout of
+            # the default branch and no pull. Without a remote copy, use the
+            # local default branch.
+            if self._resolve(f"refs/remotes/origin/{default_branch}"):
+                start_point = ["--no-track", f"origin/{default_branch}"]
+            elif self._resolve(f"refs/heads/{default_branch}"):
+                start_point = [default_branch]
+            else:
+                start_point = []
+            success, error = self._run_command(["git", "checkout", "-b", branch_name] + start_point)
         
         if success:
-            console.print(f"[green]✓[/green] Created branch: {branch_name}")
+            _print(f"[green]✓[/green] Created branch: {branch_name}")
             return True, branch_name
         else:
-            console.print(f"[red]✗[/red] Failed to create branch: {error}")
+            _print(f"[red]✗[/red] Failed to create branch: {error}")
             return False, error
     
     def commit_changes(self, pbi_key: str, message: str) -> Tuple[bool, str]:
         """Stage all changes and commit."""
+        self._invalidate_queries()
         success, _ = self._run_command(["git", "add", "-A"])
         if not success:
             return False, "Failed to stage changes"
         
-        success, status = self._run_command(["git", "status", "--porcelain"])
-        if success and not status:
+        # Everything is staged now, so the index vs HEAD diff is the whole story
+        if self._exit_code(["git", "diff", "--cached", "--quiet"]) == 0:
             return False, "No changes to commit"
         
         full_message = f"feat({pbi_key}): {message}"
-        success, output = self._run_command(
-            ["git", "commit", "-m", full_message],
-            check=False
-        )
+        success, output = self._run_command(["git", "commit", "-m", full_message])
         
         if success:
-            _, commit_hash = self._run_command(["git", "rev-parse", "--short", "HEAD"])
-            console.print(f"[green]✓[/green] Committed: {commit_hash} - {full_message[:50]}...")
+            # git commit already prints the short hash; avoid another rev-parse
+            match = _COMMIT_SUMMARY_RE.search(output)
+            if match:
+                commit_hash = match.group(1)
+            else:
+                _, commit_hash = self._run_command(["git", "rev-parse", "--short", "HEAD"])
+            _print(f"[green]✓[/green] Committed: {commit_hash} - {full_message[:50]}...")
             return True, commit_hash
         else:
             return False, output
     
     def has_remote(self) -> bool:
         """Check if repository has a remote configured."""
-        success, output = self._run_command(["git", "remote"], check=False)
+        success, output = self._cached_run_command(["git", "remote"])
         return success and bool(output.strip())
     
     def push_branch(self, branch_name: Optional[str] = None) -> Tuple[bool, str]:
         """Push current or specified branch to origin."""
         # Check if remote exists
         if not self.has_remote():
-            console.print("[red]✗[/red] No git remote configured!")
-            console.print("[yellow]Tip: Add a remote with: git remote add origin <url>[/yellow]")
+            _print("[red]✗[/red] No git remote configured!")
+            _print("[yellow]Tip: Add a remote with: git remote add origin <url>[/yellow]")
             return False, "No remote configured"
         
         branch = branch_name or self.get_current_branch()
@@ -160,10 +382,10 @@ class GitAutomation:
         )
         
         if success or "Everything up-to-date" in output:
-            console.print(f"[green]✓[/green] Pushed branch: {branch}")
+            _print(f"[green]✓[/green] Pushed branch: {branch}")
             return True, output
         else:
-            console.print(f"[red]✗[/red] Failed to push: {output}")
+            _print(f"[red]✗[/red] Failed to push: {output}")
             return False, output
     
     def create_pull_request(self, pbi: PBIData, draft: bool = False) -> Tuple[bool, str]:
@@ -173,84 +395,72 @@ class GitAutomation:
         
         # Check if remote exists
         if not self.has_remote():
-            console.print("[red]✗[/red] No git remote configured - cannot create PR!")
-            console.print("[yellow]Tip: Add a remote with: git remote add origin https://github.com/user/repo.git[/yellow]")
+            _print("[red]✗[/red] No git remote configured - cannot create PR!")
+            _print("[yellow]Tip: Add a remote with: git remote add origin https://github.com/user/repo.git[/yellow]")
             return False, "No remote configured"
         
         title = f"[{pbi.key}] {pbi.summary}"
         body = self._build_pr_body(pbi)
         base_branch = self.get_default_branch()
         
+        # Body goes through stdin: no argv copy, and no 32K command-line limit on Windows
         cmd = [
             "gh", "pr", "create",
             "--title", title,
-            "--body", body,
+            "--body-file", "-",
             "--base", base_branch
         ]
         
         if draft:
             cmd.append("--draft")
         
-        success, output = self._run_command(cmd, check=False)
+        # check=True: with check=False _run_command reports success for any exit code
+        success, output = self._run_command(cmd, input=body)
         
         if success:
             pr_url = output.strip().split('\n')[-1]
-            console.print(f"[green]✓[/green] Created PR: {pr_url}")
+            _print(f"[green]✓[/green] Created PR: {pr_url}")
             return True, pr_url
         else:
-            console.print(f"[red]✗[/red] Failed to create PR: {output}")
+            # Token expired or revoked since the check: probe again next time
+            if "auth" in output.lower() or "401" in output:
+                self._gh_auth_ok = False
+            _print(f"[red]✗[/red] Failed to create PR: {output}")
             return False, output
     
     def _build_pr_body(self, pbi: PBIData) -> str:
         """Build PR description from PBI data."""
+        ac_lines = [f"- [ ] {ac}" for ac in pbi.acceptance_criteria] or ["- [ ] _Add acceptance criteria_"]
         
-        ac_checklist = ""
-        if pbi.acceptance_criteria:
-            ac_checklist = "\n".join(f"- [ ] {ac}" for ac in pbi.acceptance_criteria)
-        else:
-            ac_checklist = "- [ ] _Add acceptance criteria_"
-        
-        return f'''## 📋 Summary
-
-{pbi.summary}
-
-**Jira:** [{pbi.key}]({pbi.url})  
-**Type:** {pbi.issue_type} | **Priority:** {pbi.priority}
-
----
-
-## 📝 Description
-
-{pbi.description if pbi.description else "_See Jira for details._"}
-
----
-
-## ✅ Acceptance Criteria
-
-{ac_checklist}
-
----
-
-## 🧪 Testing
-
-- [ ] Unit tests added/updated
-- [ ] All tests passing
-- [ ] Manual testing completed
-
----
-
-_This PR was created by Agentic Workflow Tool_
-'''
+        return _PR_BODY_TEMPLATE.format(
+            summary=pbi.summary,
+            key=pbi.key,
+            url=pbi.url,
+            issue_type=pbi.issue_type,
+            priority=pbi.priority,
+            description=pbi.description or "_See Jira for details._",
+            ac_checklist="\n".join(ac_lines)
+        )
     
     def has_uncommitted_changes(self) -> bool:
-        """Check if there are uncommitted changes."""
+        """Check if there are uncommitted changes (untracked files included)."""
+        # Tracked changes: exit code only, no output to read or parse
+        code = self._exit_code(["git", "diff", "--quiet", "HEAD"])
+        if code == 1:
+            return True
+        if code == 0:
+            success, untracked = self._run_command(["git", "ls-files", "--others", "--exclude-standard"])
+            return bool(untracked) if success else False
+        
+        # No HEAD yet (fresh repository) or git failed
         success, output = self._run_command(["git", "status", "--porcelain"])
         return bool(output.strip()) if success else False
     
-    def checkout_branch(self, branch_name: str) -> bool:
+    def checkout_branch(self, branch_name: str, force_fetch: bool = False) -> bool:
         """Checkout an existing branch."""
         # Fetch first to ensure we have latest
-        self._run_command(["git", "fetch", "origin"], check=False)
+        self.fetch_origin(force_fetch)
+        self._invalidate_queries()
         
         # Try checkout
         success, error = self._run_command(
@@ -266,11 +476,15 @@ _This PR was created by Agentic Workflow Tool_
             )
         
         return success
-    
-    def get_last_commit_hash(self) -> str:
-        """Get the short hash of the last commit."""
-        success, output = self._run_command(["git", "rev-parse", "--short", "HEAD"])
-        return output if success else "unknown"
 
 
-git_automation = GitAutomation()
+# Singleton, created on first access
+@lru_cache(maxsize=None)
+def _default_git_automation() -> GitAutomation:
+    return GitAutomation()
+
+
+def __getattr__(name: str):
+    if name == "git_automation":
+        return _default_git_automation()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,13 +1,29 @@
 """Jira API connector for fetching and updating issues."""
 
+import re
 from dataclasses import dataclass
-from typing import Optional
-from jira import JIRA
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional
+from urllib.parse import urlparse
 from rich.console import Console
 
+from .cache import disk_memoize
+from ._cli_common import plain_printer
 from .config import jira_config
 
+if TYPE_CHECKING:
+    from jira import JIRA
+
 console = Console()
+_print = plain_printer(console)
+
+# Jira issue key, e.g. 'PROJ-123'; also what makes a key safe to put in JQL
+_ISSUE_KEY_RE = re.compile(r'[A-Z][A-Z0-9_]*-\d+')
+
+_AC_HEADER_RE = re.compile(r'acceptance criteria|ac:|criteria:', re.IGNORECASE)
+_BULLET_CHARS = ('-', '*', '•')
+# Lines starting with these stay inside the AC section even if they contain ':'
+_AC_ITEM_PREFIXES = (' ', '-', '*', '•', '\t')
 
 
 @dataclass
@@ -29,38 +45,109 @@ class PBIData:
 class JiraConnector:
     """Handles all Jira API operations."""
     
+    # Issue fields PBIData is built from
+    PBI_FIELDS = "summary,description,status,issuetype,priority,labels,assignee,reporter"
+    
     def __init__(self):
         """Initialize Jira connection."""
-        self._client: Optional[JIRA] = None
+        self._client: Optional["JIRA"] = None
+        self._server_base = jira_config.server.rstrip('/')
+        # (project, issue type, status) -> (transition lookup, transition names)
+        self._transition_cache: dict[tuple[str, str, str], tuple[dict[str, str], list[str]]] = {}
     
-    def _connect(self) -> JIRA:
+    def _connect(self) -> "JIRA":
         """Establish connection to Jira."""
         if not self._client:
+            # Imported here: the jira package is slow to load and only
+            # needed once we actually talk to Jira
+            from jira import JIRA
+            
             if not all([jira_config.server, jira_config.email, jira_config.api_token]):
                 raise ValueError(
                     "Missing Jira configuration. Please set JIRA_SERVER, "
                     "JIRA_EMAIL, and JIRA_API_TOKEN in .env file.\n"
                     "Config location: ~/.agentic/.env or current directory"
                 )
+            # Skip the serverInfo round-trip on connect; Jira Cloud is
+            # recognisable from its host name, which is all jira needs it for
             self._client = JIRA(
                 server=jira_config.server,
-                basic_auth=(jira_config.email, jira_config.api_token)
+                basic_auth=(jira_config.email, jira_config.api_token),
+                get_server_info=False,
+                max_retries=3
             )
+            if (urlparse(jira_config.server).hostname or "").endswith(".atlassian.net"):
+                self._client.deploymentType = "Cloud"
         return self._client
     
     def fetch_pbi(self, issue_key: str) -> PBIData:
         """
         Fetch PBI details from Jira.
         
+        Results are cached on disk for 5 minutes (see agentic.cache), so
+        re-running a paused workflow doesn't hit Jira again.
+        
         Args:
             issue_key: Jira issue key (e.g., 'PBI-123', 'PROJ-456')
-            
+        
         Returns:
             PBIData with parsed issue information
         """
+        # Jira keys are case-insensitive; one spelling means one cache entry
+        return self._fetch_pbi(issue_key.strip().upper())
+    
+    # Keyed by Jira server and user too, so switching instances or accounts
+    # never serves another one's issue
+    @disk_memoize(ttl=300, scope=lambda: (jira_config.server, jira_config.email))
+    def _fetch_pbi(self, issue_key: str) -> PBIData:
+        client = self._connect()
+        issue = client.issue(issue_key, fields=self.PBI_FIELDS)
+        return self._to_pbi(issue)
+    
+    def fetch_pbis(self, issue_keys: list[str]) -> dict[str, PBIData]:
+        """
+        Fetch several PBIs with a single JQL search instead of one request each.
+        
+        The workflow itself handles one PBI per run; this is for tooling
+        that needs many at once (reports, batch scripts).
+        
+        Returns a dict keyed by issue key. A JQL `key in (...)` search fails
+        as a whole if any key doesn't exist, so in that case each key is
+        fetched on its own and the unknown ones are left out.
+        
+        Raises:
+            ValueError: if a key doesn't look like an issue key ('PROJ-123')
+        """
+        from jira.exceptions import JIRAError
+        
+        keys = [key.strip().upper() for key in issue_keys]
+        invalid = [key for key in keys if not _ISSUE_KEY_RE.fullmatch(key)]
+        if invalid:
+            raise ValueError(f"Invalid Jira issue key(s): {', '.join(invalid)}")
+        if not keys:
+            return {}
+        
         client = self._connect()
-        issue = client.issue(issue_key)
+        jql = "key in ({})".format(", ".join(keys))
+        try:
+            issues = client.search_issues(jql, fields=self.PBI_FIELDS, maxResults=len(keys))
+            return {issue.key: self._to_pbi(issue) for issue in issues}
+        except JIRAError as e:
+            # 400 is the "issue does not exist" answer; anything else is real
+            if e.status_code != 400:
+                raise
         
+        pbis = {}
+        for key in keys:
+            try:
+                pbis[key] = self.fetch_pbi(key)
+            except JIRAError as e:
+                if e.status_code != 404:
+                    raise
+        return pbis
+    
+    def _to_pbi(self, issue) -> PBIData:
+        """Convert a jira Issue into PBIData."""
         # Parse description for acceptance criteria
         description = issue.fields.description or ""
         acceptance_criteria = self._parse_acceptance_criteria(description)
@@ -70,71 +157,81 @@ class JiraConnector:
             summary=issue.fields.summary,
             description=description,
             acceptance_criteria=acceptance_criteria,
-            status=str(issue.fields.status),
-            issue_type=str(issue.fields.issuetype),
-            priority=str(issue.fields.priority) if issue.fields.priority else "None",
+            status=issue.fields.status.name,
+            issue_type=issue.fields.issuetype.name,
+            priority=issue.fields.priority.name if issue.fields.priority else "None",
             labels=list(issue.fields.labels) if issue.fields.labels else [],
             assignee=str(issue.fields.assignee) if issue.fields.assignee else None,
             reporter=str(issue.fields.reporter) if issue.fields.reporter else "Unknown",
-            url=f"{jira_config.server.rstrip('/')}/browse/{issue.key}"
+            url=f"{self._server_base}/browse/{issue.key}"
         )
     
     def _parse_acceptance_criteria(self, description: str) -> list[str]:
         """Extract acceptance criteria from description."""
         criteria = []
-        lines = description.split('\n')
+        bullets = []  # Fallback when there is no AC section
         in_ac_section = False
         
-        for line in lines:
-            line_lower = line.lower().strip()
+        # Single pass: AC-section lines and plain bullets are collected together
+        for line in description.split('\n'):
+            stripped = line.strip()
+            if not stripped:
+                continue
+            
+            if stripped.startswith(_BULLET_CHARS):
+                clean_line = stripped.lstrip('-*•').strip()
+                if clean_line:
+                    bullets.append(clean_line)
             
-            if any(marker in line_lower for marker in ['acceptance criteria', 'ac:', 'criteria:']):
+            if _AC_HEADER_RE.search(line):
                 in_ac_section = True
                 continue
             
-            if in_ac_section and line.strip() and not line.startswith((' ', '-', '*', '•', '\t')) and ':' in line:
-                if not any(c.isdigit() for c in line.split(':')[0]):
+            if not in_ac_section:
+                continue
+            
+            if not line.startswith(_AC_ITEM_PREFIXES) and ':' in line:
+                if not any(c.isdigit() for c in line.split(':', 1)[0]):
                     in_ac_section = False
                     continue
             
-            if in_ac_section and line.strip():
-                clean_line = line.strip().lstrip('-*•').lstrip('0123456789.').strip()
-                if clean_line:
-                    criteria.append(clean_line)
+            clean_line = stripped.lstrip('-*•').lstrip('0123456789.').strip()
+            if clean_line:
+                criteria.append(clean_line)
         
-        if not criteria:
-            for line in lines:
-                stripped = line.strip()
-                if stripped.startswith(('-', '*', '•')):
-                    clean_line = stripped.lstrip('-*•').strip()
-                    if clean_line:
-                        criteria.append(clean_line)
-        
-        return criteria
+        return criteria or bullets
     
     def update_status(self, issue_key: str, target_status: str) -> bool:
         """Update Jira issue status."""
+        issue_key = issue_key.strip().upper()
         client = self._connect()
-        issue = client.issue(issue_key)
+        # Just what the transition cache key needs
+        issue = client.issue(issue_key, fields="project,issuetype,status")
         
-        transitions = client.transitions(issue)
+        # Available transitions depend on the workflow (project + type) and
+        # on the issue's current status, so that's the cache key
+        cache_key = (issue.fields.project.key, issue.fields.issuetype.name, issue.fields.status.name)
+        cached = self._transition_cache.get(cache_key)
+        if cached is None:
+            lookup = {}  # lowercased transition or target status name -> id
+            names = []
+            for t in client.transitions(issue):
+                names.append(t['name'])
+                lookup.setdefault(t['name'].lower(), t['id'])
+                lookup.setdefault(t.get('to', {}).get('name', '').lower(), t['id'])
+            cached = self._transition_cache[cache_key] = (lookup, names)
         
-        transition_id = None
-        for t in transitions:
-            if t['name'].lower() == target_status.lower():
-                transition_id = t['id']
-                break
-            if t.get('to', {}).get('name', '').lower() == target_status.lower():
-                transition_id = t['id']
-                break
+        lookup, names = cached
+        transition_id = lookup.get(target_status.lower())
         
         if transition_id:
             client.transition_issue(issue, transition_id)
-            console.print(f"[green]✓[/green] Updated {issue_key} status → {target_status}")
+            # The cached PBI still carries the old status
+            JiraConnector._fetch_pbi.cache_invalidate(issue_key)
+            _print(f"[green]✓[/green] Updated {issue_key} status → {target_status}")
             return True
         else:
-            available = [t['name'] for t in transitions]
-            console.print(f"[yellow]![/yellow] Cannot transition to '{target_status}'. Available: {available}")
+            _print(f"[yellow]![/yellow] Cannot transition to '{target_status}'. Available: {names}")
             return False
     
     def transition_to_in_progress(self, issue_key: str) -> bool:
@@ -150,4 +247,13 @@ class JiraConnector:
         return self.update_status(issue_key, jira_config.status_done)
 
 
-jira_connector = JiraConnector()
+# Singleton, created on first access
+@lru_cache(maxsize=None)
+def _default_jira_connector() -> JiraConnector:
+    return JiraConnector()
+
+
+def __getattr__(name: str):
+    if name == "jira_connector":
+        return _default_jira_connector()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
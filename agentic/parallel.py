@@ -0,0 +1,24 @@
+"""Run independent I/O-bound calls (Jira, git, gh) concurrently."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+
+def run_parallel(tasks: dict[str, Callable[[], Any]], max_workers: int = 4) -> dict[str, Any]:
+    """
+    Call every task on a thread pool and return {name: result}.
+    
+    A task that raises gets its exception as the result, so one failing
+    call doesn't discard the others' results.
+    """
+    if not tasks:
+        return {}
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tasks))) as pool:
+        futures = {name: pool.submit(task) for name, task in tasks.items()}
+    
+    results = {}
+    for name, future in futures.items():
+        error = future.exception()
+        results[name] = error if error is not None else future.result()
+    return results
@@ -2,15 +2,58 @@
 
 import subprocess
 import json
+import os
 import re
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from io import StringIO
 
-from rich.console import Console
+from . import cache
+from ._cli_common import _console
 
-console = Console()
+# Remote URL after the scheme: [user@]host(:|/)owner/repo[.git]
+_REMOTE_URL_RE = re.compile(
+    r'^(?:[a-z+]+://)?(?:[^@/]+@)?(?P<host>[^:/]+)(?::\d+)?[:/](?P<owner>[^/]+)/(?P<repo>[^/]+?)(?:\.git)?/?$'
+)
+
+
+@lru_cache(maxsize=None)
+def _gh_hosts() -> frozenset[str]:
+    """
+    Hosts gh has a login for: github.com plus the top-level keys of gh's
+    hosts.yml, read once per process.
+    """
+    if os.environ.get("GH_CONFIG_DIR"):
+        config_dir = Path(os.environ["GH_CONFIG_DIR"])
+    elif os.environ.get("XDG_CONFIG_HOME"):
+        config_dir = Path(os.environ["XDG_CONFIG_HOME"]) / "gh"
+    elif os.name == "nt" and os.environ.get("AppData"):
+        config_dir = Path(os.environ["AppData"]) / "GitHub CLI"
+    else:
+        config_dir = Path.home() / ".config" / "gh"
+    
+    hosts = {"github.com"}
+    try:
+        for line in (config_dir / "hosts.yml").read_text(encoding="utf-8").splitlines():
+            # Host entries are the unindented "name:" keys
+            if line and not line[0].isspace() and line.rstrip().endswith(":"):
+                hosts.add(line.rstrip()[:-1].strip("'\"").lower())
+    except OSError:
+        pass
+    return frozenset(hosts)
+
+
+# Page number of the rel="last" link in a Link header
+_LAST_PAGE_RE = re.compile(r'[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+# A reply containing any of these marks its comment as already fixed
+_FIXED_RE = re.compile(r'fixed in commit|fixed in |done|resolved|applied|✅', re.IGNORECASE)
 
 
 class CommentCategory(Enum):
@@ -33,7 +76,7 @@ class FixDifficulty(Enum):
     DISCUSSION = "discussion"  # Not a fix, needs reply
 
 
-@dataclass
+@dataclass(slots=True)
 class PRComment:
     """Parsed PR review comment."""
     id: int
@@ -54,6 +97,7 @@ class PRComment:
     # Reply tracking
     replies: list = field(default_factory=list)  # List of reply bodies
     is_fixed: bool = False  # True if already replied with "Fixed in commit"
+    node_id: Optional[str] = None  # GraphQL id, lets replies be batched
     
     def to_dict(self):
         return {
@@ -70,7 +114,7 @@ class PRComment:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class PRReviewSummary:
     """Summary of PR review analysis."""
     pr_number: int
@@ -82,174 +126,432 @@ class PRReviewSummary:
     complex_fixes: list[PRComment] = field(default_factory=list)
     discussions: list[PRComment] = field(default_factory=list)
     resolved: list[PRComment] = field(default_factory=list)
+    
+    def partition(self) -> dict[str, tuple[list[PRComment], list[PRComment]]]:
+        """
+        Split each actionable category into (pending, already fixed) in one pass.
+        
+        Keys: auto_fixable, simple_fixes, complex_fixes, discussions.
+        """
+        result = {}
+        for name in ("auto_fixable", "simple_fixes", "complex_fixes", "discussions"):
+            pending, fixed = [], []
+            for comment in getattr(self, name):
+                (fixed if comment.is_fixed else pending).append(comment)
+            result[name] = (pending, fixed)
+        return result
 
 
 class PRReviewFetcher:
     """Fetches PR review comments via gh CLI."""
     
+    # Aliased mutations per GraphQL request, well inside GitHub's limits
+    REPLY_BATCH_SIZE = 20
+    # Concurrent gh calls; more mostly trips GitHub's secondary rate limit
+    MAX_PARALLEL_REQUESTS = 8
+    # ETags are always revalidated; the TTL only bounds how long unused entries linger
+    ETAG_CACHE_TTL = 7 * 24 * 60 * 60
+    # GitHub's maximum; the default of 30 means more round-trips on busy PRs
+    PAGE_SIZE = 100
+    
     def __init__(self, working_dir: Optional[Path] = None):
         self.working_dir = working_dir or Path.cwd()
+        # endpoint -> (etag, body) of the last successful GET
+        self._etag_cache: dict[str, tuple[str, str]] = {}
+        # working dir -> (host, "owner/repo") or None if it couldn't be read
+        self._repo_cache: dict[Path, Optional[tuple[str, str]]] = {}
+        # (working dir, PR number or branch) -> `gh pr view` result
+        self._pr_info_cache: dict[tuple[Path, str], dict] = {}
+    
+    def _resolve_repo(self) -> Optional[tuple[str, str]]:
+        """
+        (host, "owner/repo") of the repository gh would pick, read from git
+        config once per working dir.
+        
+        gh answers `{owner}/{repo}` placeholders by spawning git itself on
+        every call; resolving them here saves that on each request. The
+        remote marked by `gh repo set-default` wins, then upstream, github,
+        origin, as in gh.
+        """
+        if self.working_dir in self._repo_cache:
+            return self._repo_cache[self.working_dir]
+        
+        repo = None
+        try:
+            result = subprocess.run(
+                ["git", "config", "--get-regexp", r"^remote\..*\.(url|gh-resolved)$"],
+                cwd=self.working_dir,
+                capture_output=True,
+                text=True,
+                encoding='utf-8',
+                errors='replace'
+            )
+            urls, resolved = {}, None
+            for line in result.stdout.splitlines():
+                key, _, value = line.partition(" ")
+                remote, _, attr = key[len("remote."):].rpartition(".")
+                if attr == "url":
+                    urls.setdefault(remote, value)
+                elif value == "base":
+                    resolved = remote
+            
+            order = [resolved, "upstream", "github", "origin"] + list(urls)
+            remote = next((r for r in order if r in urls), None)
+            match = _REMOTE_URL_RE.match(urls[remote]) if remote else None
+            if match:
+                repo = (match.group("host").lower(), f"{match.group('owner')}/{match.group('repo')}")
+        except FileNotFoundError:
+            pass
+        
+        self._repo_cache[self.working_dir] = repo
+        return repo
+    
+    def _api_args(self, endpoint: str) -> list[str]:
+        """`gh api` arguments for `endpoint` with the repo placeholders filled in."""
+        repo = self._resolve_repo()
+        if not repo:
+            # Leave {owner}/{repo} for gh to work out
+            return ["api", endpoint]
+        
+        host, slug = repo
+        if host not in _gh_hosts():
+            # An SSH alias (~/.ssh/config) or ssh.github.com isn't a host gh
+            # can log in to; gh maps those back to the real host itself
+            return ["api", endpoint]
+        
+        args = ["api", endpoint.replace("{owner}/{repo}", slug)]
+        if host != "github.com":
+            args += ["--hostname", host]
+        return args
     
     def _run_gh(self, args: list[str]) -> Tuple[bool, str]:
         """Run gh CLI command."""
+        # Raw bytes + one decode; gh always writes UTF-8, so the text
+        # wrapper subprocess would set up is only extra copying
         try:
             result = subprocess.run(
                 ["gh"] + args,
                 cwd=self.working_dir,
                 capture_output=True,
-                text=True,
-                encoding='utf-8',
-                errors='replace',
                 check=True
             )
-            return True, result.stdout.strip() if result.stdout else ""
+            return True, result.stdout.decode('utf-8', 'replace').strip()
         except subprocess.CalledProcessError as e:
-            return False, e.stderr.strip() if e.stderr else str(e)
+            return False, e.stderr.decode('utf-8', 'replace').strip() or str(e)
         except FileNotFoundError:
             return False, "gh CLI not found"
     
-    def get_pr_for_branch(self, branch: str) -> Optional[dict]:
-        """Get PR info for a branch."""
-        success, output = self._run_gh([
-            "pr", "view", branch,
-            "--json", "number,title,url,state,headRefName"
-        ])
+    def _run_gh_output(self, args: list[str]) -> str:
+        """
+        Run gh CLI command and return stdout whatever the exit code.
         
-        if success:
-            return json.loads(output)
-        return None
+        `gh api graphql` exits non-zero when any part of a request fails but
+        still prints the response, which says which parts succeeded.
+        """
+        try:
+            result = subprocess.run(
+                ["gh"] + args,
+                cwd=self.working_dir,
+                capture_output=True
+            )
+            return result.stdout.decode('utf-8', 'replace')
+        except FileNotFoundError:
+            return ""
     
-    def get_pr_by_number(self, pr_number: int) -> Optional[dict]:
-        """Get PR info by number."""
-        success, output = self._run_gh([
-            "pr", "view", str(pr_number),
-            "--json", "number,title,url,state,headRefName"
-        ])
+    def _api_get(self, endpoint: str, revalidate: bool = True) -> Optional[tuple[str, Optional[int]]]:
+        """
+        GET a REST endpoint via `gh api`, revalidating with the last ETag.
         
-        if success:
-            return json.loads(output)
-        return None
+        A 304 answer reuses the cached body and doesn't count against
+        GitHub's rate limit. ETags are kept on disk too, so a later run
+        revalidates instead of downloading everything again. Returns the
+        body and the last page number from the Link header (1 when the
+        response isn't paginated; None after a 304, which says nothing
+        about later pages), or None on failure.
+        """
+        args = self._api_args(endpoint) + ["-i"]
+        cache_key = repr((str(self.working_dir), endpoint))
+        cached = self._etag_cache.get(endpoint) or cache.load("gh_api", cache_key, self.ETAG_CACHE_TTL)
+        if cached and revalidate:
+            args += ["-H", f"If-None-Match: {cached[0]}"]
+        
+        # -i prints the status line and headers before the body
+        head, sep, body = self._run_gh_output(args).replace("\r\n", "\n").partition("\n\n")
+        if not sep:
+            return None
+        
+        lines = head.split("\n")
+        status = lines[0].split()[1:2]
+        if status == ["304"] and cached:
+            return cached[1], None
+        if not status or not status[0].startswith("2"):
+            return None
+        
+        body = body.strip()
+        etag, last_page = None, 1
+        for line in lines[1:]:
+            name, _, value = line.partition(":")
+            name = name.lower()
+            if name == "etag":
+                etag = value.strip()
+            elif name == "link":
+                match = _LAST_PAGE_RE.search(value)
+                if match:
+                    last_page = int(match.group(1))
+        
+        if etag:
+            self._etag_cache[endpoint] = (etag, body)
+            cache.store("gh_api", cache_key, self._etag_cache[endpoint])
+        return body, last_page
     
-    def fetch_review_comments(self, pr_number: int) -> list[PRComment]:
-        """Fetch all review comments for a PR, including reply status."""
-        # Get review comments (inline comments on code)
-        # Using graphql to get comments with their replies
-        success, output = self._run_gh([
-            "api", f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments",
-            "--jq", "."
-        ])
+    def _api_get_all(self, endpoint: str) -> Optional[list]:
+        """
+        GET every page of a list endpoint, 100 items per page.
         
-        comments = []
-        comment_ids = []  # Track IDs to fetch replies
+        The first page says how many there are; the rest are fetched in
+        parallel. Returns the concatenated items, or None if any page
+        failed: a partial list would silently drop items.
+        """
+        first_page = f"{endpoint}?per_page={self.PAGE_SIZE}"
+        first = self._api_get(first_page)
+        if first is None:
+            return None
         
-        if success and output:
+        body, last_page = first
+        if last_page is None:
+            # Page 1 unchanged (304). Items are oldest first, so a page 1
+            # that isn't full is still the whole list; a full one may have
+            # new items on later pages, and only a 200 carries the count.
             try:
-                raw_comments = json.loads(output)
-                for c in raw_comments:
-                    comment_id = c["id"]
-                    comment_ids.append(comment_id)
-                    
-                    # Check if this is a reply (has in_reply_to_id)
-                    # Skip reply comments as they are not original review comments
-                    if c.get("in_reply_to_id"):
-                        continue
-                    
-                    comments.append(PRComment(
-                        id=comment_id,
-                        author=c["user"]["login"],
-                        body=c["body"],
-                        file_path=c.get("path"),
-                        line=c.get("line") or c.get("original_line"),
-                        diff_hunk=c.get("diff_hunk"),
-                        created_at=c["created_at"],
-                        state=c.get("state", "SUBMITTED")
-                    ))
+                full = len(json.loads(body)) >= self.PAGE_SIZE
             except json.JSONDecodeError:
-                pass
+                full = False
+            if full:
+                first = self._api_get(first_page, revalidate=False)
+                if first is None:
+                    return None
+                body, last_page = first
+            else:
+                last_page = 1
+        bodies = [body]
+        if last_page > 1:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_PARALLEL_REQUESTS, last_page - 1)) as pool:
+                pages = list(pool.map(
+                    lambda page: self._api_get(f"{endpoint}?per_page={self.PAGE_SIZE}&page={page}"),
+                    range(2, last_page + 1)
+                ))
+            if not all(pages):
+                return None
+            bodies += [page[0] for page in pages]
         
-        # Fetch replies for each comment and check if already fixed
-        self._populate_reply_status(pr_number, comments, output)
+        items = []
+        for page_body in bodies:
+            try:
+                items.extend(json.loads(page_body))
+            except json.JSONDecodeError:
+                return None
+        return items
+    
+    def get_pr_for_branch(self, branch: str) -> Optional[dict]:
+        """Get PR info for a branch."""
+        return self._get_pr_info(branch)
+    
+    def get_pr_by_number(self, pr_number: int) -> Optional[dict]:
+        """Get PR info by number."""
+        return self._get_pr_info(str(pr_number))
+    
+    def _get_pr_info(self, selector: str) -> Optional[dict]:
+        """`gh pr view` for a PR number or branch, memoized until invalidate()."""
+        key = (self.working_dir, selector)
+        if key in self._pr_info_cache:
+            return self._pr_info_cache[key]
         
-        # Also get issue comments (general PR comments)
         success, output = self._run_gh([
-            "api", f"repos/{{owner}}/{{repo}}/issues/{pr_number}/comments",
-            "--jq", "."
+            "pr", "view", selector,
+            "--json", "id,number,title,url,state,headRefName,updatedAt"
         ])
         
-        if success and output:
-            try:
-                raw_comments = json.loads(output)
-                for c in raw_comments:
-                    comments.append(PRComment(
-                        id=c["id"],
-                        author=c["user"]["login"],
-                        body=c["body"],
-                        file_path=None,
-                        line=None,
-                        diff_hunk=None,
-                        created_at=c["created_at"],
-                        state="SUBMITTED"
-                    ))
-            except json.JSONDecodeError:
-                pass
-        
-        return comments
+        pr_info = json.loads(output) if success else None
+        if pr_info:
+            self._pr_info_cache[key] = pr_info
+        return pr_info
     
-    def _populate_reply_status(self, pr_number: int, comments: list[PRComment], raw_output: str):
-        """Check replies to comments and mark fixed ones."""
-        if not raw_output:
-            return
+    def invalidate(self):
+        """Forget memoized PR info, e.g. after changing the PR."""
+        self._pr_info_cache.clear()
+    
+    def fetch_review_comments(self, pr_number: int) -> Optional[list[PRComment]]:
+        """
+        Fetch all review comments for a PR, including reply status.
         
-        try:
-            all_comments = json.loads(raw_output)
-        except json.JSONDecodeError:
-            return
+        Returns None if any page of either list couldn't be fetched, rather
+        than a list that quietly misses comments or their replies.
+        """
+        # Review comments (inline on code) and issue comments (general PR
+        # comments) are independent, so fetch both at once
+        self._resolve_repo()
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            review_future = pool.submit(self._api_get_all, f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments")
+            issue_future = pool.submit(self._api_get_all, f"repos/{{owner}}/{{repo}}/issues/{pr_number}/comments")
+        review_items, issue_items = review_future.result(), issue_future.result()
+        if review_items is None or issue_items is None:
+            return None
         
-        # Build a map of comment_id -> replies
-        reply_map = {}  # parent_id -> list of reply bodies
-        for c in all_comments:
+        # One pass: top-level comments by id, replies grouped by parent
+        by_id: dict[int, PRComment] = {}
+        reply_map = defaultdict(list)  # parent_id -> list of reply bodies
+        
+        for c in review_items:
             parent_id = c.get("in_reply_to_id")
             if parent_id:
-                if parent_id not in reply_map:
-                    reply_map[parent_id] = []
                 reply_map[parent_id].append(c["body"])
-        
-        # Update comments with their replies
-        for comment in comments:
-            replies = reply_map.get(comment.id, [])
-            comment.replies = replies
+                continue
             
-            # Check if any reply indicates this was fixed
-            for reply in replies:
-                reply_lower = reply.lower()
-                if any(marker in reply_lower for marker in [
-                    "fixed in commit",
-                    "fixed in ",
-                    "done",
-                    "resolved",
-                    "applied",
-                    "✅"
-                ]):
-                    comment.is_fixed = True
-                    break
+            by_id[c["id"]] = PRComment(
+                id=c["id"],
+                author=c["user"]["login"],
+                body=c["body"],
+                file_path=c.get("path"),
+                line=c.get("line") or c.get("original_line"),
+                diff_hunk=c.get("diff_hunk"),
+                created_at=c["created_at"],
+                state=c.get("state", "SUBMITTED"),
+                node_id=c.get("node_id")
+            )
+        
+        # Attach replies and mark comments a reply says were fixed
+        for parent_id, replies in reply_map.items():
+            comment = by_id.get(parent_id)
+            if comment:
+                comment.replies = replies
+                comment.is_fixed = any(_FIXED_RE.search(reply) for reply in replies)
+        comments = list(by_id.values())
+        
+        # Also add issue comments (general PR comments)
+        for c in issue_items:
+            comments.append(PRComment(
+                id=c["id"],
+                author=c["user"]["login"],
+                body=c["body"],
+                file_path=None,
+                line=None,
+                diff_hunk=None,
+                created_at=c["created_at"],
+                state="SUBMITTED"
+            ))
+        
+        return comments
     
     def reply_to_comment(self, pr_number: int, comment_id: int, body: str) -> bool:
-        """Reply to a review comment."""
-        success, _ = self._run_gh([
-            "api", f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments/{comment_id}/replies",
-            "-f", f"body={body}"
-        ])
+        """Reply to a review comment, backing off on GitHub's secondary rate limit."""
+        for attempt in range(3):
+            success, output = self._run_gh(self._api_args(
+                f"repos/{{owner}}/{{repo}}/pulls/{pr_number}/comments/{comment_id}/replies"
+            ) + [
+                "-f", f"body={body}"
+            ])
+            if success or "rate limit" not in output.lower():
+                break
+            time.sleep(2 ** attempt)
+        if success:
+            self.invalidate()
         return success
     
+    def reply_to_comments_batch(
+        self,
+        pr_number: int,
+        replies: list[tuple[PRComment, str]],
+        pr_node_id: Optional[str] = None
+    ) -> list[bool]:
+        """
+        Reply to several review comments, up to REPLY_BATCH_SIZE per GraphQL request.
+        
+        Replies the batch could not post (no node id, or a failed alias) are
+        retried one at a time over REST. Returns success per reply, in order.
+        """
+        if pr_node_id is None:
+            pr_info = self.get_pr_by_number(pr_number)
+            pr_node_id = pr_info.get("id") if pr_info else None
+        
+        results = [False] * len(replies)
+        batchable = [i for i, (comment, _) in enumerate(replies) if pr_node_id and comment.node_id]
+        chunks = [
+            batchable[start:start + self.REPLY_BATCH_SIZE]
+            for start in range(0, len(batchable), self.REPLY_BATCH_SIZE)
+        ]
+        # Batches and REST fallbacks are independent requests; overlap their latency
+        with ThreadPoolExecutor(max_workers=self.MAX_PARALLEL_REQUESTS) as pool:
+            posted = pool.map(lambda chunk: self._post_reply_batch(pr_node_id, [replies[i] for i in chunk]), chunks)
+            for chunk, chunk_posted in zip(chunks, posted):
+                for i, ok in zip(chunk, chunk_posted):
+                    results[i] = ok
+            
+            retry = [i for i, ok in enumerate(results) if not ok]
+            posted = pool.map(lambda i: self.reply_to_comment(pr_number, replies[i][0].id, replies[i][1]), retry)
+            for i, ok in zip(retry, posted):
+                results[i] = ok
+        return results
+    
+    def _post_reply_batch(self, pr_node_id: str, replies: list[tuple[PRComment, str]]) -> list[bool]:
+        """
+        Post replies as aliased mutations in one GraphQL document.
+        
+        When GitHub's rate limit rejects part of the batch, the rejected
+        replies are resent together after a backoff rather than left to
+        the per-comment REST fallback.
+        """
+        results = [False] * len(replies)
+        pending = list(range(len(replies)))
+        for attempt in range(3):
+            posted, output = self._send_reply_mutations(pr_node_id, [replies[i] for i in pending])
+            for i, ok in zip(pending, posted):
+                results[i] = ok
+            pending = [i for i in pending if not results[i]]
+            if not pending or "rate limit" not in output.lower():
+                break
+            time.sleep(2 ** attempt)
+        if any(results):
+            self.invalidate()
+        return results
+    
+    def _send_reply_mutations(self, pr_node_id: str, replies: list[tuple[PRComment, str]]) -> tuple[list[bool], str]:
+        """Send one aliased-mutation request. Returns success per reply and the raw response."""
+        declarations = ["$pr: ID!"]
+        fields = []
+        variables = ["-f", f"pr={pr_node_id}"]
+        for n, (comment, body) in enumerate(replies):
+            declarations.append(f"$to{n}: ID!, $body{n}: String!")
+            fields.append(
+                f"r{n}: addPullRequestReviewComment("
+                f"input: {{pullRequestId: $pr, inReplyTo: $to{n}, body: $body{n}}}) {{ comment {{ id }} }}"
+            )
+            variables += ["-f", f"to{n}={comment.node_id}", "-f", f"body{n}={body}"]
+        
+        query = f"mutation({', '.join(declarations)}) {{\n  " + "\n  ".join(fields) + "\n}"
+        output = self._run_gh_output(self._api_args("graphql") + ["-f", f"query={query}"] + variables)
+        
+        try:
+            data = json.loads(output).get("data") or {}
+        except (json.JSONDecodeError, AttributeError):
+            data = {}
+        return [bool(data.get(f"r{n}")) for n in range(len(replies))], output
+    
     def post_pr_comment(self, pr_number: int, body: str) -> bool:
         """Post a general comment on PR."""
         success, _ = self._run_gh([
             "pr", "comment", str(pr_number),
             "--body", body
         ])
+        if success:
+            self.invalidate()
         return success
 
 
+def _any_of(patterns: list[str]) -> re.Pattern:
+    """One regex matching wherever any of `patterns` does (text is pre-lowercased)."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns))
+
+
 class CommentAnalyzer:
     """Analyzes PR comments and categorizes them."""
     
@@ -280,6 +582,20 @@ class CommentAnalyzer:
         r'\brename\b', r'\bwrong\b', r'\bincorrect\b', r'\bbug\b'
     ]
     
+    # Each category compiled once, so a check is a single scan of the text
+    _APPROVAL_RE = _any_of(APPROVAL_PATTERNS)
+    _QUESTION_RE = _any_of(QUESTION_PATTERNS)
+    _NITPICK_RE = _any_of(NITPICK_PATTERNS)
+    _SUGGESTION_RE = _any_of(SUGGESTION_PATTERNS)
+    _CODE_FIX_RE = _any_of(CODE_FIX_PATTERNS)
+    
+    # Plain substrings (not words) hinting at a logic issue
+    LOGIC_KEYWORDS = [
+        'logic', 'handle', 'case', 'error', 'null', 'undefined', 'edge',
+        'guard', 'none', 'typeerror', 'crash'
+    ]
+    _LOGIC_RE = re.compile("|".join(map(re.escape, LOGIC_KEYWORDS)))
+    
     # Auto-fixable patterns with fix templates
     AUTO_FIX_PATTERNS = {
         r'use\s+[`\']?(const|let)[`\']?\s+instead\s+of\s+[`\']?(var|let|const)[`\']?': 
@@ -299,28 +615,42 @@ class CommentAnalyzer:
         r'rename\s+[`\']?(\w+)[`\']?\s+to\s+[`\']?(\w+)[`\']?':
             lambda m: f"Rename `{m.group(1)}` to `{m.group(2)}`",
     }
+    _AUTO_FIX_RES = [(re.compile(p), fix) for p, fix in AUTO_FIX_PATTERNS.items()]
+    # Every auto-fix pattern needs one of these words; most comments have none
+    _AUTO_FIX_TRIGGER_RE = re.compile(r'use|remove|missing|typo|spelling|extra|should|rename')
+    
+    # Substrings suggesting a one-line fix, scanned for in one pass
+    SIMPLE_INDICATORS = [
+        'rename', 'typo', 'import', 'const', 'let', 'var',
+        'semicolon', 'comma', 'bracket', 'parenthesis',
+        'guard', 'check', 'if not', 'or []', 'or {}', '= None',
+        'exists', 'missing'
+    ]
+    _SIMPLE_INDICATORS_RE = re.compile("|".join(map(re.escape, SIMPLE_INDICATORS)))
+    _CODE_BLOCK_RE = re.compile(r'```\w*\s*\n(.*?)\n```', re.DOTALL)
     
     def analyze(self, comment: PRComment) -> PRComment:
         """Analyze and categorize a comment."""
+        # Lowercased once; every check below works on this copy
         body_lower = comment.body.lower().strip()
         
         # Check approval first
-        if self._matches_patterns(body_lower, self.APPROVAL_PATTERNS):
+        if self._matches_patterns(body_lower, self._APPROVAL_RE):
             comment.category = CommentCategory.APPROVAL
             comment.difficulty = FixDifficulty.DISCUSSION
             return comment
         
         # Check questions
-        if self._matches_patterns(body_lower, self.QUESTION_PATTERNS):
+        if self._matches_patterns(body_lower, self._QUESTION_RE):
             comment.category = CommentCategory.QUESTION
             comment.difficulty = FixDifficulty.DISCUSSION
             comment.draft_reply = self._generate_question_reply(comment)
             return comment
         
         # Check nitpicks
-        if self._matches_patterns(body_lower, self.NITPICK_PATTERNS):
+        if self._matches_patterns(body_lower, self._NITPICK_RE):
             comment.category = CommentCategory.NITPICK
-            auto_fix = self._try_auto_fix(comment)
+            auto_fix = self._try_auto_fix(comment, body_lower)
             if auto_fix:
                 comment.difficulty = FixDifficulty.AUTO
                 comment.suggested_fix = auto_fix
@@ -329,20 +659,20 @@ class CommentAnalyzer:
             return comment
         
         # Check suggestions
-        if self._matches_patterns(body_lower, self.SUGGESTION_PATTERNS):
+        if self._matches_patterns(body_lower, self._SUGGESTION_RE):
             comment.category = CommentCategory.SUGGESTION
             comment.difficulty = FixDifficulty.DISCUSSION
             comment.draft_reply = self._generate_suggestion_reply(comment)
             return comment
         
         # Check code fixes
-        if self._matches_patterns(body_lower, self.CODE_FIX_PATTERNS):
+        if self._matches_patterns(body_lower, self._CODE_FIX_RE):
             comment.category = CommentCategory.CODE_FIX
-            auto_fix = self._try_auto_fix(comment)
+            auto_fix = self._try_auto_fix(comment, body_lower)
             if auto_fix:
                 comment.difficulty = FixDifficulty.AUTO
                 comment.suggested_fix = auto_fix
-            elif self._is_simple_fix(comment):
+            elif self._is_simple_fix(comment, body_lower):
                 comment.difficulty = FixDifficulty.SIMPLE
             else:
                 comment.difficulty = FixDifficulty.COMPLEX
@@ -351,25 +681,25 @@ class CommentAnalyzer:
         # Check for code blocks with fixes (even if not matching other patterns)
         if '```python' in comment.body or '```suggestion' in comment.body:
             comment.category = CommentCategory.CODE_FIX
-            auto_fix = self._try_auto_fix(comment)
+            auto_fix = self._try_auto_fix(comment, body_lower)
             if auto_fix:
                 comment.difficulty = FixDifficulty.AUTO
                 comment.suggested_fix = auto_fix
-            elif self._is_simple_fix(comment):
+            elif self._is_simple_fix(comment, body_lower):
                 comment.difficulty = FixDifficulty.SIMPLE
             else:
                 comment.difficulty = FixDifficulty.COMPLEX
             return comment
         
         # Check for logic issues
-        if any(word in body_lower for word in ['logic', 'handle', 'case', 'error', 'null', 'undefined', 'edge', 'guard', 'none', 'typeerror', 'crash']):
+        if self._LOGIC_RE.search(body_lower):
             comment.category = CommentCategory.LOGIC_ISSUE
             # Check if there's a suggested fix pattern
-            auto_fix = self._try_auto_fix(comment)
+            auto_fix = self._try_auto_fix(comment, body_lower)
             if auto_fix:
                 comment.difficulty = FixDifficulty.AUTO
                 comment.suggested_fix = auto_fix
-            elif self._is_simple_fix(comment):
+            elif self._is_simple_fix(comment, body_lower):
                 comment.difficulty = FixDifficulty.SIMPLE
             else:
                 comment.difficulty = FixDifficulty.COMPLEX
@@ -380,21 +710,17 @@ class CommentAnalyzer:
         comment.difficulty = FixDifficulty.COMPLEX
         return comment
     
-    def _matches_patterns(self, text: str, patterns: list[str]) -> bool:
-        """Check if text matches any pattern."""
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
+    def _matches_patterns(self, text: str, compiled: re.Pattern) -> bool:
+        """Check if text matches any of a category's patterns."""
+        return compiled.search(text) is not None
     
-    def _try_auto_fix(self, comment: PRComment) -> Optional[str]:
-        """Try to generate auto-fix for comment."""
-        body_lower = comment.body.lower()
-        
-        for pattern, fix_func in self.AUTO_FIX_PATTERNS.items():
-            match = re.search(pattern, body_lower, re.IGNORECASE)
-            if match:
-                return fix_func(match)
+    def _try_auto_fix(self, comment: PRComment, body_lower: str) -> Optional[str]:
+        """Try to generate auto-fix for comment (`body_lower` is its lowercased body)."""
+        if self._AUTO_FIX_TRIGGER_RE.search(body_lower):
+            for pattern, fix_func in self._AUTO_FIX_RES:
+                match = pattern.search(body_lower)
+                if match:
+                    return fix_func(match)
         
         # Check for code suggestion in comment (```suggestion blocks)
         suggestion_match = re.search(r'```suggestion\s*\n(.*?)\n```', comment.body, re.DOTALL)
@@ -416,24 +742,16 @@ class CommentAnalyzer:
         
         return None
     
-    def _is_simple_fix(self, comment: PRComment) -> bool:
+    def _is_simple_fix(self, comment: PRComment, body_lower: str) -> bool:
         """Determine if fix is simple (one-liner)."""
-        simple_indicators = [
-            'rename', 'typo', 'import', 'const', 'let', 'var',
-            'semicolon', 'comma', 'bracket', 'parenthesis',
-            'guard', 'check', 'if not', 'or []', 'or {}', '= None',
-            'exists', 'missing'
-        ]
-        body_lower = comment.body.lower()
-        
         # Check for simple code blocks (1-3 lines)
-        code_match = re.search(r'```\w*\s*\n(.*?)\n```', comment.body, re.DOTALL)
+        code_match = self._CODE_BLOCK_RE.search(comment.body)
         if code_match:
             code_lines = code_match.group(1).strip().split('\n')
             if len(code_lines) <= 3:
                 return True
         
-        return any(ind in body_lower for ind in simple_indicators)
+        return self._SIMPLE_INDICATORS_RE.search(body_lower) is not None
     
     def _generate_question_reply(self, comment: PRComment) -> str:
         """Generate draft reply for question."""
@@ -444,9 +762,21 @@ class CommentAnalyzer:
         return f"_[Draft reply for suggestion]_\n\nThanks for the suggestion! [Accept/Decline with reason]"
 
 
+def _analyze_comment(comment: PRComment) -> PRComment:
+    """Process pool entry point (must be module-level to pickle)."""
+    return CommentAnalyzer().analyze(comment)
+
+
 class PRReviewManager:
     """Manages the full PR review workflow."""
     
+    # Bump when analysis rules change so cached summaries are recomputed
+    SUMMARY_CACHE_VERSION = 2
+    SUMMARY_CACHE_TTL = 24 * 60 * 60
+    # Below this many comments starting worker processes costs more than
+    # the analysis itself
+    PARALLEL_ANALYSIS_MIN = 500
+    
     def __init__(self, working_dir: Optional[Path] = None):
         self.working_dir = working_dir or Path.cwd()
         self.fetcher = PRReviewFetcher(working_dir)
@@ -466,18 +796,42 @@ class PRReviewManager:
             pr_info = self.fetcher.get_pr_for_branch(pr_identifier)
         
         if not pr_info:
-            console.print(f"[red]✗[/red] Could not find PR: {pr_identifier}")
+            _console().print(f"[red]✗[/red] Could not find PR: {pr_identifier}")
             return None
         
         pr_number = pr_info["number"]
-        console.print(f"[green]✓[/green] Found PR #{pr_number}: {pr_info['title']}")
+        _console().print(f"[green]✓[/green] Found PR #{pr_number}: {pr_info['title']}")
+        
+        # Nothing to redo if the PR hasn't changed since the last analysis
+        updated_at = pr_info.get("updatedAt")
+        cache_key = repr((str(self.working_dir), pr_number, self.SUMMARY_CACHE_VERSION))
+        if updated_at:
+            cached = cache.load("pr_summary", cache_key, self.SUMMARY_CACHE_TTL)
+            if cached and cached[0] == updated_at:
+                _console().print("[green]✓[/green] PR unchanged since last analysis, using cached results")
+                return cached[1]
+        
+        summary = self._analyze_comments(pr_info)
+        # Only a complete fetch is worth keeping; an error isn't cached
+        if summary is None:
+            return None
+        if updated_at:
+            cache.store("pr_summary", cache_key, (updated_at, summary))
+        return summary
+    
+    def _analyze_comments(self, pr_info: dict) -> Optional[PRReviewSummary]:
+        """Fetch and categorize all comments of a PR (None if the fetch failed)."""
+        pr_number = pr_info["number"]
         
         # Fetch comments
         comments = self.fetcher.fetch_review_comments(pr_number)
-        console.print(f"[green]✓[/green] Fetched {len(comments)} comments")
+        if comments is None:
+            _console().print(f"[red]✗[/red] Could not fetch all comments of PR #{pr_number} (gh error), try again")
+            return None
+        _console().print(f"[green]✓[/green] Fetched {len(comments)} comments")
         
         if not comments:
-            console.print("[yellow]No review comments found[/yellow]")
+            _console().print("[yellow]No review comments found[/yellow]")
             return PRReviewSummary(
                 pr_number=pr_number,
                 pr_title=pr_info["title"],
@@ -493,21 +847,30 @@ class PRReviewManager:
             total_comments=len(comments)
         )
         
-        for comment in comments:
-            analyzed = self.analyzer.analyze(comment)
-            
-            if analyzed.category == CommentCategory.APPROVAL:
-                summary.resolved.append(analyzed)
-            elif analyzed.category == CommentCategory.RESOLVED:
-                summary.resolved.append(analyzed)
-            elif analyzed.difficulty == FixDifficulty.AUTO:
-                summary.auto_fixable.append(analyzed)
-            elif analyzed.difficulty == FixDifficulty.SIMPLE:
-                summary.simple_fixes.append(analyzed)
-            elif analyzed.difficulty == FixDifficulty.DISCUSSION:
-                summary.discussions.append(analyzed)
-            else:
-                summary.complex_fixes.append(analyzed)
+        if len(comments) >= self.PARALLEL_ANALYSIS_MIN:
+            with ProcessPoolExecutor() as pool:
+                analyzed_comments = list(pool.map(_analyze_comment, comments, chunksize=64))
+        else:
+            analyzed_comments = [self.analyzer.analyze(comment) for comment in comments]
+        
+        # (category, difficulty) -> summary list; approvals and resolved
+        # comments go to resolved whatever their difficulty
+        by_difficulty = {
+            FixDifficulty.AUTO: summary.auto_fixable,
+            FixDifficulty.SIMPLE: summary.simple_fixes,
+            FixDifficulty.DISCUSSION: summary.discussions
+        }
+        targets = {
+            (category, difficulty): (
+                summary.resolved
+                if category in (CommentCategory.APPROVAL, CommentCategory.RESOLVED)
+                else by_difficulty.get(difficulty, summary.complex_fixes)
+            )
+            for category in CommentCategory
+            for difficulty in FixDifficulty
+        }
+        for analyzed in analyzed_comments:
+            targets[analyzed.category, analyzed.difficulty].append(analyzed)
         
         return summary
     
@@ -533,7 +896,7 @@ class PRReviewManager:
             discussions_content = self._build_discussions_context(summary)
             discussions_file.write_text(discussions_content, encoding='utf-8')
         
-        # Save raw data for CLI
+        # Save raw data for CLI (compact; it's for tools, not for reading)
         data_file = review_dir / "review_data.json"
         data = {
             "pr_number": summary.pr_number,
@@ -544,7 +907,7 @@ class PRReviewManager:
             "complex_fixes": [c.to_dict() for c in summary.complex_fixes],
             "discussions": [c.to_dict() for c in summary.discussions]
         }
-        data_file.write_text(json.dumps(data, indent=2), encoding='utf-8')
+        data_file.write_text(json.dumps(data, separators=(",", ":")), encoding='utf-8')
         
         return review_file
     
@@ -604,100 +967,91 @@ agentic pr reply {summary.pr_number}
 ---
 _Generated by Agentic Workflow_
 '''
-    
+
     def _build_fixes_context(self, summary: PRReviewSummary) -> str:
         """Build fixes context markdown."""
-        sections = []
+        # Every piece goes straight into one buffer, no per-comment strings
+        buf = StringIO()
+        buf.write(f"# 🔧 Fixes Needed: PR #{summary.pr_number}\n\n")
         
         if summary.auto_fixable:
-            sections.append("## 🤖 Auto-fixable\n")
-            sections.append("_These can be fixed automatically:_\n")
+            buf.write("## 🤖 Auto-fixable\n_These can be fixed automatically:_\n")
             for c in summary.auto_fixable:
-                sections.append(self._format_fix_comment(c))
+                self._format_fix_comment(c, buf)
         
         if summary.simple_fixes:
-            sections.append("\n## 🔧 Simple Fixes\n")
-            sections.append("_Quick one-liner fixes:_\n")
+            buf.write("\n## 🔧 Simple Fixes\n_Quick one-liner fixes:_\n")
             for c in summary.simple_fixes:
-                sections.append(self._format_fix_comment(c))
+                self._format_fix_comment(c, buf)
         
         if summary.complex_fixes:
-            sections.append("\n## 🔨 Complex Fixes\n")
-            sections.append("_Need analysis - use Copilot:_\n")
+            buf.write("\n## 🔨 Complex Fixes\n_Need analysis - use Copilot:_\n")
             for c in summary.complex_fixes:
-                sections.append(self._format_fix_comment(c))
-                sections.append(f'''
-**Copilot Prompt:**
-```
-@workspace Fix this review comment in {c.file_path or 'the code'}:
-"{c.body[:200]}"
-```
-''')
+                self._format_fix_comment(c, buf)
+                buf.write("\n**Copilot Prompt:**\n```\n@workspace Fix this review comment in ")
+                buf.write(c.file_path or 'the code')
+                buf.write(':\n"')
+                buf.write(c.body[:200])
+                buf.write('"\n```\n')
         
-        return f'''# 🔧 Fixes Needed: PR #{summary.pr_number}
-
-{"".join(sections)}
+        buf.write("\n\n---\n_Generated by Agentic Workflow_\n")
+        return buf.getvalue()
 
----
-_Generated by Agentic Workflow_
-'''
-    
-    def _format_fix_comment(self, comment: PRComment) -> str:
-        """Format a fix comment for markdown."""
-        location = ""
+    def _format_fix_comment(self, comment: PRComment, buf: StringIO):
+        """Write a fix comment as markdown to `buf`."""
+        buf.write("\n### ")
+        buf.write(comment.category.value.replace('_', ' ').title())
+        buf.write("\n")
         if comment.file_path:
-            location = f"📍 `{comment.file_path}`"
+            buf.write(f"📍 `{comment.file_path}`")
             if comment.line:
-                location += f" (line {comment.line})"
-        
-        fix_section = ""
+                buf.write(f" (line {comment.line})")
+        buf.write("\n\n> ")
+        buf.write(comment.body)
+        buf.write("\n\n**Author:** @")
+        buf.write(comment.author)
+        buf.write("\n")
         if comment.suggested_fix:
-            fix_section = f"\n**Suggested fix:** {comment.suggested_fix}"
-        
-        return f'''
-### {comment.category.value.replace('_', ' ').title()}
-{location}
-
-> {comment.body}
-
-**Author:** @{comment.author}
-{fix_section}
+            buf.write("\n**Suggested fix:** ")
+            buf.write(comment.suggested_fix)
+        buf.write("\n\n---\n")
 
----
-'''
-    
     def _build_discussions_context(self, summary: PRReviewSummary) -> str:
         """Build discussions context markdown."""
-        sections = []
+        buf = StringIO()
+        buf.write(f"# 💬 Discussions: PR #{summary.pr_number}\n\n_Review and customize replies before posting._\n\n")
         
         for c in summary.discussions:
-            draft = c.draft_reply or "_[Write your reply here]_"
-            sections.append(f'''
-### {c.category.value.replace('_', ' ').title()} from @{c.author}
-
-> {c.body}
-
-**Draft reply:**
-{draft}
-
----
-''')
+            buf.write("\n### ")
+            buf.write(c.category.value.replace('_', ' ').title())
+            buf.write(" from @")
+            buf.write(c.author)
+            buf.write("\n\n> ")
+            buf.write(c.body)
+            buf.write("\n\n**Draft reply:**\n")
+            buf.write(c.draft_reply or "_[Write your reply here]_")
+            buf.write("\n\n---\n")
         
-        return f'''# 💬 Discussions: PR #{summary.pr_number}
-
-_Review and customize replies before posting._
-
-{"".join(sections)}
+        buf.write(
+            "\n\n## Post all replies\n"
+            "```bash\n"
+            f"agentic pr reply {summary.pr_number} --confirm\n"
+            "```\n\n"
+            "---\n"
+            "_Generated by Agentic Workflow_\n"
+        )
+        return buf.getvalue()
 
-## Post all replies
-```bash
-agentic pr reply {summary.pr_number} --confirm
-```
 
----
-_Generated by Agentic Workflow_
-'''
+# Singleton, created on first access
+@lru_cache(maxsize=None)
+def _default_pr_review_manager() -> PRReviewManager:
+    return PRReviewManager()
 
 
-# Singleton
-pr_review_manager = PRReviewManager()
+def __getattr__(name: str):
+    if name == "pr_review_manager":
+        return _default_pr_review_manager()
+    if name == "console":
+        return _console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
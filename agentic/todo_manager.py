@@ -4,16 +4,22 @@ import json
 from pathlib import Path
 from dataclasses import dataclass, field
 from typing import List, Optional
+from functools import lru_cache
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-
+from ._cli_common import _console
 from .config import workflow_config
+from .enhanced_context_generator import _render_todo_markdown, _write_file
+
+
+def _index_by_id(todos) -> dict[int, int]:
+    """{task id: position} for todo dicts as stored in todo.json (first wins)."""
+    index = {}
+    for i, t in enumerate(todos):
+        index.setdefault(t["id"], i)
+    return index
 
 
-@dataclass
+@dataclass(slots=True)
 class TodoItem:
     """A single TODO item."""
     id: int
@@ -49,10 +55,21 @@ class TodoManager:
         "implementation": "green",
         "general": "white"
     }
+    # Category column markup, built once rather than per row
+    CATEGORY_CELLS = {cat: f"[{color}]{cat}[/{color}]" for cat, color in CATEGORY_COLORS.items()}
     
     def __init__(self):
-        self.console = Console()
         self.context_dir = workflow_config.context_dir
+        # todo.json path -> save_todos arguments not yet written (see flush)
+        self._unsaved: dict[Path, tuple] = {}
+        # todo.json path -> (st_mtime_ns, decoded data, {task id: list position})
+        # as last read or written
+        self._loaded: dict[Path, tuple[int, dict, dict[int, int]]] = {}
+    
+    @property
+    def console(self):
+        """Shared console; rich is only imported once something is printed."""
+        return _console()
     
     def get_todo_file(self, pbi_key: str, working_dir: Optional[Path] = None) -> Path:
         """Get path to TODO JSON file for a PBI."""
@@ -63,57 +80,69 @@ class TodoManager:
         """Load TODOs from file. Returns (pbi_summary, todos)."""
         file_path = self.get_todo_file(pbi_key, working_dir)
         
-        if not file_path.exists():
+        if file_path in self._unsaved:
+            _, summary, todos, _ = self._unsaved[file_path]
+            return summary, todos
+        
+        try:
+            mtime = file_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return None, []
         
-        data = json.loads(file_path.read_text(encoding='utf-8'))
+        # Only re-read and decode when the file changed since last time
+        cached = self._loaded.get(file_path)
+        if cached and cached[0] == mtime:
+            data = cached[1]
+        else:
+            data = json.loads(file_path.read_bytes())
+            self._loaded[file_path] = (mtime, data, _index_by_id(data.get("todos", [])))
+        
+        # Fresh items every call, so callers can't alter the cached data
         todos = [TodoItem.from_dict(t) for t in data.get("todos", [])]
         return data.get("summary", ""), todos
     
-    def save_todos(self, pbi_key: str, summary: str, todos: List[TodoItem], working_dir: Optional[Path] = None):
-        """Save TODOs to file."""
+    def save_todos(
+        self,
+        pbi_key: str,
+        summary: str,
+        todos: List[TodoItem],
+        working_dir: Optional[Path] = None,
+        defer: bool = False
+    ):
+        """
+        Save TODOs to file.
+        
+        With `defer`, only remember them until flush(), so a run of edits
+        writes todo.json and todo.md once instead of after every edit.
+        """
         file_path = self.get_todo_file(pbi_key, working_dir)
+        if defer:
+            self._unsaved[file_path] = (pbi_key, summary, todos, working_dir)
+            return
+        
+        self._unsaved.pop(file_path, None)
         data = {
             "pbi_key": pbi_key,
             "summary": summary,
             "todos": [t.to_dict() for t in todos]
         }
-        file_path.write_text(json.dumps(data, indent=2), encoding='utf-8')
-        self._update_markdown(pbi_key, summary, todos, working_dir)
+        # Compact, like the generator writes it; todo.md is the readable view
+        _write_file((file_path, json.dumps(data, separators=(",", ":"))))
+        self._loaded[file_path] = (file_path.stat().st_mtime_ns, data, _index_by_id(data.get("todos", [])))
+        self._update_markdown(pbi_key, summary, data["todos"], working_dir)
+    
+    def flush(self):
+        """Write every deferred save."""
+        for args in list(self._unsaved.values()):
+            self.save_todos(*args)
     
-    def _update_markdown(self, pbi_key: str, summary: str, todos: List[TodoItem], working_dir: Optional[Path] = None):
-        """Update the markdown TODO file."""
+    def _update_markdown(self, pbi_key: str, summary: str, todos: List[dict], working_dir: Optional[Path] = None):
+        """Update the markdown TODO file (`todos` as stored in todo.json)."""
         working_dir = working_dir or Path.cwd()
         md_path = working_dir / self.context_dir / pbi_key / "todo.md"
         
-        def render_category(cat: str, name: str):
-            items = [t for t in todos if t.category == cat]
-            if not items:
-                return ""
-            
-            lines = [f"\n## {name}"]
-            for t in items:
-                check = "x" if t.status == "done" else " "
-                prefix = "🔄 " if t.status == "in_progress" else ""
-                lines.append(f"- [{check}] {prefix}{t.title}")
-            return "\n".join(lines)
-        
-        done_count = len([t for t in todos if t.status == "done"])
-        total = len(todos)
-        pct = int(done_count / total * 100) if total > 0 else 0
-        
-        content = f'''# ✅ TODO: {pbi_key}
-
-> **{summary}**
-{render_category("requirement", "📋 Requirements")}
-{render_category("test", "🧪 Tests")}
-{render_category("implementation", "🔨 Implementation")}
-{render_category("general", "📝 General")}
-
----
-**Progress:** {done_count}/{total} ({pct}%)
-'''
-        md_path.write_text(content, encoding='utf-8')
+        # _write_file leaves the file alone if it already has this content
+        _write_file((md_path, _render_todo_markdown(pbi_key, summary, todos)))
     
     def show(self, pbi_key: str, working_dir: Optional[Path] = None):
         """Display TODOs in a nice table."""
@@ -124,9 +153,11 @@ class TodoManager:
             self.console.print(f"[dim]Run 'agentic {pbi_key}' first to generate context.[/dim]")
             return
         
-        done_count = len([t for t in todos if t.status == "done"])
+        done_count = sum(t.status == "done" for t in todos)
         pct = int(done_count / len(todos) * 100)
         
+        from rich.table import Table
+        
         table = Table(title=f"📋 {pbi_key}: {summary}")
         table.add_column("#", style="dim", width=4)
         table.add_column("Status", width=6)
@@ -134,16 +165,16 @@ class TodoManager:
         table.add_column("Category", width=14)
         
         for todo in todos:
-            icon = self.STATUS_ICONS.get(todo.status, "⬜")
-            color = self.CATEGORY_COLORS.get(todo.category, "white")
-            style = "dim" if todo.status == "done" else ""
+            category = self.CATEGORY_CELLS.get(todo.category)
+            if category is None:
+                category = f"[white]{todo.category}[/white]"
             
             table.add_row(
                 str(todo.id),
-                icon,
+                self.STATUS_ICONS.get(todo.status, "⬜"),
                 todo.title,
-                f"[{color}]{todo.category}[/{color}]",
-                style=style
+                category,
+                style="dim" if todo.status == "done" else ""
             )
         
         self.console.print(table)
@@ -162,14 +193,34 @@ class TodoManager:
             self.console.print(f"[yellow]No TODOs found for {pbi_key}[/yellow]")
             return
         
+        from rich.panel import Panel
+        
         self.console.print(Panel.fit(
             f"[bold]Interactive TODO Manager[/bold]\n"
             f"[dim]{pbi_key}: {summary}[/dim]",
             border_style="blue"
         ))
         
+        # Edits are saved once on the way out, including on Ctrl+C
+        try:
+            self._interactive_loop(pbi_key, summary, todos, working_dir)
+        finally:
+            self.flush()
+    
+    def _interactive_loop(self, pbi_key: str, summary: str, todos: List[TodoItem], working_dir: Optional[Path]):
+        """Command loop of interactive(); edits are deferred saves."""
+        from rich.prompt import Prompt
+        
+        # The list never changes shape here, only statuses, so index it once
+        # (reversed, so a duplicated id resolves to its first task as before)
+        by_id = {t.id: t for t in reversed(todos)}
+        shown = None
         while True:
-            self.show(pbi_key, working_dir)
+            # Redraw the table only after a command actually changed something
+            state = [t.status for t in todos]
+            if state != shown:
+                self.show(pbi_key, working_dir)
+                shown = state
             self.console.print("\n[dim]Commands: (n)ext, (d)one, (u)ndo, (s)tart, (q)uit[/dim]")
             
             cmd = Prompt.ask("Command", default="q")
@@ -181,7 +232,7 @@ class TodoManager:
                 pending = [t for t in todos if t.status == "pending"]
                 if pending:
                     pending[0].status = "in_progress"
-                    self.save_todos(pbi_key, summary, todos, working_dir)
+                    self.save_todos(pbi_key, summary, todos, working_dir, defer=True)
                     self.console.print(f"[green]Started: {pending[0].title}[/green]")
                 else:
                     self.console.print("[yellow]No pending tasks![/yellow]")
@@ -190,37 +241,37 @@ class TodoManager:
                 in_progress = [t for t in todos if t.status == "in_progress"]
                 if in_progress:
                     in_progress[0].status = "done"
-                    self.save_todos(pbi_key, summary, todos, working_dir)
+                    self.save_todos(pbi_key, summary, todos, working_dir, defer=True)
                     self.console.print(f"[green]✓ Done: {in_progress[0].title}[/green]")
                 else:
                     # Or select one
                     task_id = Prompt.ask("Task ID to mark done")
                     try:
-                        task = next(t for t in todos if t.id == int(task_id))
+                        task = by_id[int(task_id)]
                         task.status = "done"
-                        self.save_todos(pbi_key, summary, todos, working_dir)
+                        self.save_todos(pbi_key, summary, todos, working_dir, defer=True)
                         self.console.print(f"[green]✓ Done: {task.title}[/green]")
-                    except (StopIteration, ValueError):
+                    except (KeyError, ValueError):
                         self.console.print("[red]Invalid task ID[/red]")
             elif cmd.lower() == 's':
                 task_id = Prompt.ask("Task ID to start")
                 try:
-                    task = next(t for t in todos if t.id == int(task_id))
+                    task = by_id[int(task_id)]
                     # Reset others
                     for t in todos:
                         if t.status == "in_progress":
                             t.status = "pending"
                     task.status = "in_progress"
-                    self.save_todos(pbi_key, summary, todos, working_dir)
+                    self.save_todos(pbi_key, summary, todos, working_dir, defer=True)
                     self.console.print(f"[cyan]🔄 Started: {task.title}[/cyan]")
-                except (StopIteration, ValueError):
+                except (KeyError, ValueError):
                     self.console.print("[red]Invalid task ID[/red]")
             elif cmd.lower() == 'u':
                 # Undo last done
                 done = [t for t in todos if t.status == "done"]
                 if done:
                     done[-1].status = "pending"
-                    self.save_todos(pbi_key, summary, todos, working_dir)
+                    self.save_todos(pbi_key, summary, todos, working_dir, defer=True)
                     self.console.print(f"[yellow]↩ Undone: {done[-1].title}[/yellow]")
                 else:
                     self.console.print("[yellow]Nothing to undo[/yellow]")
@@ -228,25 +279,43 @@ class TodoManager:
                 # Maybe it's a task ID
                 try:
                     task_id = int(cmd)
-                    task = next(t for t in todos if t.id == task_id)
+                    task = by_id[task_id]
                     self.console.print(f"\nTask {task_id}: {task.title}")
                     action = Prompt.ask("Action", choices=["done", "start", "pending"], default="done")
                     task.status = "in_progress" if action == "start" else action
-                    self.save_todos(pbi_key, summary, todos, working_dir)
-                except (ValueError, StopIteration):
+                    self.save_todos(pbi_key, summary, todos, working_dir, defer=True)
+                except (ValueError, KeyError):
                     self.console.print("[red]Unknown command[/red]")
     
     def update_status(self, pbi_key: str, task_id: int, status: str, working_dir: Optional[Path] = None):
         """Update a specific task status."""
         summary, todos = self.load_todos(pbi_key, working_dir)
         
-        try:
-            task = next(t for t in todos if t.id == task_id)
-            task.status = status
-            self.save_todos(pbi_key, summary, todos, working_dir)
-            return True
-        except StopIteration:
+        # Position from the index kept with the loaded file; pending deferred
+        # edits are not indexed, so look those up directly
+        file_path = self.get_todo_file(pbi_key, working_dir)
+        if file_path in self._unsaved or file_path not in self._loaded:
+            positions = {}
+            for i, t in enumerate(todos):
+                positions.setdefault(t.id, i)
+        else:
+            positions = self._loaded[file_path][2]
+        
+        pos = positions.get(task_id)
+        if pos is None:
             return False
+        todos[pos].status = status
+        self.save_todos(pbi_key, summary, todos, working_dir)
+        return True
+
+
+# Singleton, created on first access
+@lru_cache(maxsize=None)
+def _default_todo_manager() -> TodoManager:
+    return TodoManager()
 
 
-todo_manager = TodoManager()
+def __getattr__(name: str):
+    if name == "todo_manager":
+        return _default_todo_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,9 +2,13 @@
 
 import os
 from dataclasses import dataclass
-from dotenv import load_dotenv
 
-load_dotenv()
+# Set AGENTIC_SKIP_DOTENV when the environment is already configured, to
+# skip importing python-dotenv and searching for a .env file
+if not os.environ.get("AGENTIC_SKIP_DOTENV"):
+    from dotenv import load_dotenv
+    
+    load_dotenv()
 
 
 @dataclass
@@ -1,7 +1,6 @@
 """Git and GitHub PR automation using gh CLI."""
 
 import subprocess
-import re
 from pathlib import Path
 from typing import Optional, Tuple
 
@@ -9,10 +8,51 @@ from rich.console import Console
 
 from config import git_config
 from src.jira_connector import PBIData
+from agentic.git_automation import _BRANCH_KEY_TABLE
 
 console = Console()
 
 
+# PR description, filled in by _build_pr_body
+_PR_BODY_TEMPLATE = '''## 📋 Summary
+
+{summary}
+
+**Jira:** [{key}]({url})  
+**Type:** {issue_type} | **Priority:** {priority}
+
+---
+
+## 📝 Description
+
+{description}
+
+---
+
+## ✅ Acceptance Criteria
+
+{ac_checklist}
+
+---
+
+## 🧪 Testing
+
+- [ ] Unit tests added/updated
+- [ ] All tests passing
+- [ ] Manual testing completed
+
+---
+
+## 📸 Screenshots
+
+_Add screenshots if applicable_
+
+---
+
+_This PR was created by Agentic Workflow Tool_
+'''
+
+
 class GitAutomation:
     """Handles Git operations and GitHub PR creation via gh CLI."""
     
@@ -24,6 +64,8 @@ class GitAutomation:
             working_dir: Git repository directory (default: current directory)
         """
         self.working_dir = working_dir or Path.cwd()
+        # cwd for subprocess, converted once instead of on every call
+        self._cwd = str(self.working_dir)
     
     def _run_command(self, cmd: list[str], check: bool = True) -> Tuple[bool, str]:
         """
@@ -39,7 +81,7 @@ class GitAutomation:
         try:
             result = subprocess.run(
                 cmd,
-                cwd=self.working_dir,
+                cwd=self._cwd,
                 capture_output=True,
                 text=True,
                 check=check
@@ -70,16 +112,18 @@ class GitAutomation:
             ["git", "symbolic-ref", "refs/remotes/origin/HEAD", "--short"],
             check=False
         )
-        if success:
+        # check=False reports success for any exit code; no output means no origin/HEAD
+        if success and output:
             return output.replace("origin/", "")
         
-        # Fallback: check if main or master exists
+        # Fallback: check if main or master exists, both in one git call
+        success, output = self._run_command(
+            ["git", "for-each-ref", "--format=%(refname:short)", "refs/heads/main", "refs/heads/master"],
+            check=False
+        )
+        existing = output.split() if success else []
         for branch in ["main", "master"]:
-            success, _ = self._run_command(
-                ["git", "show-ref", "--verify", f"refs/heads/{branch}"],
-                check=False
-            )
-            if success:
+            if branch in existing:
                 return branch
         
         return "main"  # Default fallback
@@ -95,7 +139,7 @@ class GitAutomation:
             Tuple of (success, branch_name or error)
         """
         # Sanitize branch name
-        safe_key = re.sub(r'[^a-zA-Z0-9-]', '-', pbi_key)
+        safe_key = pbi_key.translate(_BRANCH_KEY_TABLE)
         branch_name = f"{git_config.branch_prefix}/{safe_key}"
         
         # Fetch latest from remote
@@ -239,51 +283,17 @@ class GitAutomation:
     
     def _build_pr_body(self, pbi: PBIData) -> str:
         """Build PR description from PBI data."""
+        ac_lines = [f"- [ ] {ac}" for ac in pbi.acceptance_criteria] or ["- [ ] _Add acceptance criteria_"]
         
-        # Build AC checklist
-        ac_checklist = ""
-        if pbi.acceptance_criteria:
-            ac_checklist = "\n".join(f"- [ ] {ac}" for ac in pbi.acceptance_criteria)
-        else:
-            ac_checklist = "- [ ] _Add acceptance criteria_"
-        
-        return f'''## 📋 Summary
-
-{pbi.summary}
-
-**Jira:** [{pbi.key}]({pbi.url})  
-**Type:** {pbi.issue_type} | **Priority:** {pbi.priority}
-
----
-
-## 📝 Description
-
-{pbi.description if pbi.description else "_See Jira for details._"}
-
----
-
-## ✅ Acceptance Criteria
-
-{ac_checklist}
-
----
-
-## 🧪 Testing
-
-- [ ] Unit tests added/updated
-- [ ] All tests passing
-- [ ] Manual testing completed
-
----
-
-## 📸 Screenshots
-
-_Add screenshots if applicable_
-
----
-
-_This PR was created by Agentic Workflow Tool_
-'''
+        return _PR_BODY_TEMPLATE.format(
+            summary=pbi.summary,
+            key=pbi.key,
+            url=pbi.url,
+            issue_type=pbi.issue_type,
+            priority=pbi.priority,
+            description=pbi.description or "_See Jira for details._",
+            ac_checklist="\n".join(ac_lines)
+        )
     
     def has_uncommitted_changes(self) -> bool:
         """Check if there are uncommitted changes."""
@@ -9,216 +9,19 @@ Examples:
     python workflow.py PBI-123
     python workflow.py PROJ-456 --draft
     python workflow.py PBI-789 --skip-jira  # Skip Jira updates
+
+Runs the same workflow as `agentic <PBI-KEY>`, but writes the single-file
+Copilot context from src/context_generator.py.
 """
 
 import sys
 import argparse
 from pathlib import Path
-from typing import Optional
-
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.jira_connector import jira_connector, PBIData
-from src.context_generator import context_generator
-from src.git_automation import git_automation
-
-console = Console()
-
-
-def print_banner():
-    """Print welcome banner."""
-    console.print(Panel.fit(
-        "[bold blue]🚀 Agentic Development Workflow[/bold blue]\n"
-        "[dim]Jira → TDD → PR → Done[/dim]",
-        border_style="blue"
-    ))
-
-
-def print_step(step: int, total: int, message: str, status: str = ""):
-    """Print workflow step."""
-    status_icon = {
-        "": "⏳",
-        "done": "[green]✓[/green]",
-        "skip": "[yellow]○[/yellow]",
-        "error": "[red]✗[/red]",
-        "wait": "[cyan]⏸[/cyan]"
-    }.get(status, "⏳")
-    
-    console.print(f"{status_icon} [{step}/{total}] {message}")
-
-
-def run_workflow(
-    pbi_key: str,
-    working_dir: Optional[Path] = None,
-    skip_jira: bool = False,
-    draft_pr: bool = False
-):
-    """
-    Run the complete agentic development workflow.
-    
-    Args:
-        pbi_key: Jira issue key
-        working_dir: Project directory
-        skip_jira: Skip Jira operations (for testing)
-        draft_pr: Create PR as draft
-    """
-    working_dir = working_dir or Path.cwd()
-    total_steps = 7
-    
-    print_banner()
-    console.print(f"\n[bold]PBI:[/bold] {pbi_key}")
-    console.print(f"[bold]Directory:[/bold] {working_dir}\n")
-    
-    # ============================================
-    # Step 1: Fetch Jira PBI
-    # ============================================
-    print_step(1, total_steps, f"Fetching Jira {pbi_key}...")
-    
-    pbi: Optional[PBIData] = None
-    if skip_jira:
-        print_step(1, total_steps, "Jira fetch skipped", "skip")
-        # Create mock PBI for testing
-        pbi = PBIData(
-            key=pbi_key,
-            summary="Test PBI Summary",
-            description="Test description",
-            acceptance_criteria=["AC 1", "AC 2", "AC 3"],
-            status="To Do",
-            issue_type="Story",
-            priority="Medium",
-            labels=[],
-            assignee=None,
-            reporter="test@test.com",
-            url=f"https://jira.example.com/browse/{pbi_key}"
-        )
-    else:
-        try:
-            pbi = jira_connector.fetch_pbi(pbi_key)
-            print_step(1, total_steps, f"Fetched: {pbi.summary[:50]}...", "done")
-        except Exception as e:
-            print_step(1, total_steps, f"Failed to fetch Jira: {e}", "error")
-            console.print("\n[yellow]Tip: Check your .env configuration or use --skip-jira for testing[/yellow]")
-            return False
-    
-    # ============================================
-    # Step 2: Create feature branch
-    # ============================================
-    print_step(2, total_steps, f"Creating branch feature/{pbi_key}...")
-    
-    success, branch_name = git_automation.create_feature_branch(pbi_key)
-    if success:
-        print_step(2, total_steps, f"Branch: {branch_name}", "done")
-    else:
-        print_step(2, total_steps, f"Branch creation failed: {branch_name}", "error")
-        return False
-    
-    # ============================================
-    # Step 3: Update Jira to In Progress
-    # ============================================
-    print_step(3, total_steps, "Updating Jira → In Progress...")
-    
-    if skip_jira:
-        print_step(3, total_steps, "Jira update skipped", "skip")
-    else:
-        if jira_connector.transition_to_in_progress(pbi_key):
-            print_step(3, total_steps, "Jira status updated", "done")
-        else:
-            print_step(3, total_steps, "Could not update Jira status", "skip")
-    
-    # ============================================
-    # Step 4: Generate Copilot context
-    # ============================================
-    print_step(4, total_steps, "Generating Copilot context...")
-    
-    try:
-        context_file = context_generator.generate(pbi, working_dir)
-        print_step(4, total_steps, f"Context: {context_file.relative_to(working_dir)}", "done")
-    except Exception as e:
-        print_step(4, total_steps, f"Context generation failed: {e}", "error")
-        return False
-    
-    # ============================================
-    # Step 5: Manual implementation with Copilot
-    # ============================================
-    console.print("\n" + "─" * 50)
-    console.print(Panel.fit(
-        "[bold cyan]🛑 Manual Step: Implement with Copilot[/bold cyan]\n\n"
-        f"1. Open [bold]{context_file.relative_to(working_dir)}[/bold]\n"
-        "2. Use Copilot Chat to analyze requirements\n"
-        "3. Follow TDD: Write tests first, then implement\n"
-        "4. Come back here when ready to create PR",
-        border_style="cyan"
-    ))
-    console.print("─" * 50 + "\n")
-    
-    print_step(5, total_steps, "Waiting for implementation...", "wait")
-    
-    # Wait for user to complete implementation
-    if not Confirm.ask("\n[bold]Ready to create PR?[/bold]"):
-        console.print("[yellow]Workflow paused. Run again when ready.[/yellow]")
-        return False
-    
-    # ============================================
-    # Step 6: Commit, push, and create PR
-    # ============================================
-    print_step(6, total_steps, "Creating PR...")
-    
-    # Check for changes
-    if git_automation.has_uncommitted_changes():
-        commit_msg = Prompt.ask(
-            "Commit message",
-            default=f"Implement {pbi.summary[:40]}"
-        )
-        success, _ = git_automation.commit_changes(pbi_key, commit_msg)
-        if not success:
-            print_step(6, total_steps, "Commit failed", "error")
-            return False
-    
-    # Push branch
-    success, _ = git_automation.push_branch()
-    if not success:
-        print_step(6, total_steps, "Push failed", "error")
-        return False
-    
-    # Create PR
-    success, pr_url = git_automation.create_pull_request(pbi, draft=draft_pr)
-    if success:
-        print_step(6, total_steps, "PR created", "done")
-    else:
-        print_step(6, total_steps, f"PR creation failed: {pr_url}", "error")
-        return False
-    
-    # ============================================
-    # Step 7: Update Jira to In Review
-    # ============================================
-    print_step(7, total_steps, "Updating Jira → In Review...")
-    
-    if skip_jira:
-        print_step(7, total_steps, "Jira update skipped", "skip")
-    else:
-        if jira_connector.transition_to_in_review(pbi_key):
-            print_step(7, total_steps, "Jira status updated", "done")
-        else:
-            print_step(7, total_steps, "Could not update Jira status", "skip")
-    
-    # ============================================
-    # Done!
-    # ============================================
-    console.print("\n" + "─" * 50)
-    console.print(Panel.fit(
-        "[bold green]✅ Workflow Complete![/bold green]\n\n"
-        f"[bold]PR:[/bold] {pr_url}\n"
-        f"[bold]Jira:[/bold] {pbi.url}\n\n"
-        "[dim]Next: Review PR and merge[/dim]",
-        border_style="green"
-    ))
-    
-    return True
+from agentic.cli import run_workflow
 
 
 def main():
@@ -260,11 +63,14 @@ Examples:
     
     args = parser.parse_args()
     
+    from src.context_generator import context_generator
+    
     success = run_workflow(
         pbi_key=args.pbi_key,
         working_dir=args.dir,
         skip_jira=args.skip_jira,
-        draft_pr=args.draft
+        draft_pr=args.draft,
+        context_gen=context_generator
     )
     
     sys.exit(0 if success else 1)